@@ -21,5 +21,8 @@ setup(
       'requests',
       'pytest'
   ],
+  entry_points={
+      'console_scripts': ['zerionpy=zerionPy.cli:main']
+  },
   zip_safe=False
 )
\ No newline at end of file
@@ -0,0 +1,48 @@
+import zerionPy
+import json
+import time
+
+def response(body, status_code=200, headers=None):
+    return zerionPy.ifb.ifbResponse(headers or {}, status_code, body)
+
+class FakeResult():
+    """A requests response carrying body, as JSON or streamed in small chunks"""
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.elapsed = 0
+        self.encoding = None
+        self.body = body
+
+    def json(self):
+        return self.body
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        text = json.dumps(self.body)
+        return (text[i:i + 5] for i in range(0, len(text), 5))
+
+    def close(self):
+        pass
+
+class FakeSession():
+    """A requests session answering with outcomes in order, raising the ones that are exceptions"""
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.streamed = []
+
+    def request(self, method, url, data=None, params=None, stream=False):
+        self.calls += 1
+        self.streamed.append(stream)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+def connect(session, **kwargs):
+    """Return an IFB connection that already holds a token and sends its calls to session"""
+    api = zerionPy.IFB('server', 'us', 'client_key', 'client_secret', 8, **kwargs)
+    api._IFB__session = session
+    api._IFB__access_token = 'token'
+    api._IFB__access_token_expiration = time.time() + 3600
+    return api
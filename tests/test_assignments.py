@@ -0,0 +1,84 @@
+import zerionPy
+import threading
+import pytest
+from fakes import response
+
+class AssignmentsApi():
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.page_users = {
+            1: [{'user_id': 10, 'can_collect': True, 'can_view': False}, {'user_id': 11, 'can_collect': True, 'can_view': True}, {'user_id': 12, 'can_collect': True, 'can_view': True}],
+            2: [],
+        }
+
+    def record(self, *call):
+        with self.lock:
+            self.calls.append(call)
+
+    def getPageUserAssignments(self, profile_id, page_id, params=None):
+        return response(self.page_users[page_id][params['offset']:params['offset'] + params['limit']])
+
+    def postPageUserAssignments(self, profile_id, page_id, body):
+        self.record('post', page_id, body)
+        return response([], 201)
+
+    def putPageUserAssignments(self, profile_id, page_id, body, params=None):
+        self.record('put', page_id, body, params['fields'])
+        return response([])
+
+    def deletePageUserAssignments(self, profile_id, page_id, params=None):
+        self.record('delete', page_id, params['fields'])
+        return response([])
+
+    def getUserGroupUserAssignments(self, profile_id, usergroup_id, params=None):
+        return response([{'user_id': 10}] if params['offset'] == 0 else [])
+
+    def postUserGroupUserAssignments(self, profile_id, usergroup_id, body):
+        self.record('post', usergroup_id, body)
+        return response([], 201)
+
+    def deleteUserGroupUserAssignments(self, profile_id, usergroup_id, params=None):
+        self.record('delete', usergroup_id, params['fields'])
+        return response([])
+
+def test_diff_assignments():
+    current = {1: {'can_view': True}, 2: {'can_view': False}, 3: {'can_view': False}, 4: {'can_view': True}}
+    desired = {1: {'can_view': True}, 2: {'can_view': True}, 3: {'can_view': True}, 5: {'can_view': True}}
+
+    inserts, updates, deletes = zerionPy.diffAssignments(current, desired)
+    assert inserts == [(5, {'can_view': True})]
+    assert updates == [({'can_view': True}, [2, 3])]
+    assert deletes == [4]
+
+def test_reconcile_unknown_section():
+    with pytest.raises(ValueError):
+        zerionPy.reconcileAssignments(AssignmentsApi(), 1, {'pages': {}})
+
+def test_reconcile_assignments():
+    api = AssignmentsApi()
+    desired = {
+        'page_users': {
+            1: {10: {'can_collect': True, 'can_view': True}, 11: {'can_collect': True, 'can_view': True}, 13: {'can_collect': True}},
+            2: {},
+        },
+        'group_users': {7: [10, 14]},
+    }
+
+    report = zerionPy.reconcileAssignments(api, 1, desired, workers=4)
+    assert report[('page_users', 1)] == {'inserted': [13], 'updated': [10], 'deleted': [12]}
+    assert report[('page_users', 2)] == {'inserted': [], 'updated': [], 'deleted': []}
+    assert report[('group_users', 7)] == {'inserted': [14], 'updated': [], 'deleted': []}
+
+    assert sorted(api.calls, key=str) == sorted([
+        ('post', 1, [{'user_id': 13, 'can_collect': True}]),
+        ('put', 1, {'can_collect': True, 'can_view': True}, 'user_id((="10"))'),
+        ('delete', 1, 'user_id((="12"))'),
+        ('post', 7, [{'user_id': 14}]),
+    ], key=str)
+
+def test_reconcile_dry_run():
+    api = AssignmentsApi()
+    report = zerionPy.reconcileAssignments(api, 1, {'page_users': {1: {}}}, dry_run=True)
+    assert report[('page_users', 1)]['deleted'] == [10, 11, 12]
+    assert api.calls == []
@@ -0,0 +1,55 @@
+import zerionPy
+import re
+import pytest
+
+class ChangesApi():
+    def __init__(self, records):
+        self.records = {r['id']: r for r in records}
+        self.calls = []
+
+    def getRecords(self, profile_id, page_id, params=None):
+        self.calls.append(('get', params['fields']))
+        ids = [int(i) for i in re.findall(r'="(\d+)"', params['fields'])]
+        return zerionPy.ifb.ifbResponse({}, 200, [self.records[i] for i in ids if i in self.records])
+
+    def putRecords(self, profile_id, page_id, body, params=None):
+        self.calls.append(('put', body))
+        for record in body:
+            self.records[record['id']].update(record)
+        return zerionPy.ifb.ifbResponse({}, 200, [{'id': r['id']} for r in body])
+
+def test_diff_records():
+    remote = {1: {'id': 1, 'a': 1, 'b': 2}, 2: {'id': 2, 'a': 1}}
+    changes, unchanged, missing = zerionPy.diffRecords([{'id': 1, 'a': 1, 'b': 3}, {'id': 2, 'a': 1}, {'id': 3, 'a': 1}], remote)
+    assert changes == [{'id': 1, 'b': 3}]
+    assert unchanged == [2]
+    assert missing == [3]
+
+def test_push_changes_requires_id():
+    with pytest.raises(ValueError):
+        zerionPy.pushChanges(ChangesApi([]), 1, 2, [{'a': 1}])
+
+def test_push_changes_fetches_projection():
+    api = ChangesApi([{'id': i, 'status': 'open', 'note': 'x', 'other': 'y'} for i in range(1, 151)])
+    desired = [{'id': i, 'status': 'closed' if i <= 5 else 'open'} for i in range(1, 151)]
+
+    report = zerionPy.pushChanges(api, 1, 2, desired)
+    assert [r['id'] for r in report['updated']] == [1, 2, 3, 4, 5]
+    assert len(report['unchanged']) == 145
+
+    gets = [c[1] for c in api.calls if c[0] == 'get']
+    assert len(gets) == 2 and gets[0].endswith(',status')
+    assert [c[1] for c in api.calls if c[0] == 'put'] == [[{'id': i, 'status': 'closed'} for i in range(1, 6)]]
+
+def test_push_changes_with_snapshot(tmp_path):
+    path = str(tmp_path / 'snapshot.json')
+    api = ChangesApi([{'id': 1, 'status': 'open'}, {'id': 2, 'status': 'open'}])
+
+    zerionPy.pushChanges(api, 1, 2, [{'id': 1, 'status': 'closed'}, {'id': 2, 'status': 'open'}], snapshot=zerionPy.RecordSnapshot(path))
+
+    api.calls = []
+    snapshot = zerionPy.RecordSnapshot(path)
+    assert snapshot.get(1) == {'id': 1, 'status': 'closed'}
+
+    report = zerionPy.pushChanges(api, 1, 2, [{'id': 1, 'status': 'closed'}, {'id': 2, 'status': 'open'}], snapshot=snapshot)
+    assert report['updated'] == [] and api.calls == []
@@ -0,0 +1,143 @@
+import zerionPy
+import zerionPy.cli
+import json
+import re
+import threading
+import pytest
+from fakes import response
+
+class CliApi():
+    def __init__(self, count=2500):
+        self.lock = threading.Lock()
+        self.records = {i: {'id': i, 'status': 'open'} for i in range(1, count + 1)}
+        self.posts = []
+        self.deletes = []
+        self.option_writes = []
+
+    def getRecords(self, profile_id, page_id, params=None):
+        ids = sorted(self.records)
+        match = re.search(r'id:<\(>"(\d+)"\)', params['fields'])
+        if match:
+            ids = [i for i in ids if i > int(match.group(1))]
+
+        page = ids[params.get('offset', 0):params.get('offset', 0) + params['limit']]
+        return response([self.records[i] for i in page], headers={'Total-Count': str(len(ids))})
+
+    def postRecords(self, profile_id, page_id, body):
+        with self.lock:
+            self.posts.append(body)
+        return response([{'id': 10000 + i} for i in range(len(body))], 201)
+
+    def deleteRecords(self, profile_id, page_id, params=None):
+        with self.lock:
+            self.deletes.append((page_id, params))
+        return response([])
+
+    def getOptions(self, profile_id, optionlist_id, params=None):
+        return response([{'id': 1, 'key_value': 'ca', 'label': 'California', 'sort_order': 0}] if params['offset'] == 0 else [])
+
+    def postOptions(self, profile_id, optionlist_id, body):
+        with self.lock:
+            self.option_writes.append(('post', optionlist_id, body))
+        return response([], 201)
+
+    def putOptions(self, profile_id, optionlist_id, body, params=None):
+        with self.lock:
+            self.option_writes.append(('put', optionlist_id, body))
+        return response([])
+
+    def deleteOptions(self, profile_id, optionlist_id, params=None):
+        return response([])
+
+@pytest.fixture
+def api(monkeypatch):
+    api = CliApi()
+    monkeypatch.setattr(zerionPy.cli, '_connect', lambda args: api)
+    return api
+
+def test_export(api, tmp_path):
+    path = tmp_path / 'records.jsonl'
+    assert zerionPy.cli.main(['--quiet', '--workers', '3', 'export', '1', '2', '-o', str(path)]) == 0
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r['id'] for r in records] == list(range(1, 2501))
+
+def test_export_resume(api, tmp_path):
+    path = tmp_path / 'records.jsonl'
+    lines = ''.join(json.dumps(api.records[i]) + '\n' for i in range(1, 1001))
+    path.write_text(lines + '{"id": 10')
+
+    assert zerionPy.cli.main(['--quiet', 'export', '1', '2', '-o', str(path), '--resume']) == 0
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r['id'] for r in records] == list(range(1, 2501))
+
+@pytest.mark.parametrize('block_size', [1, 7, 1 << 20])
+def test_resume_point(tmp_path, block_size):
+    path = tmp_path / 'records.jsonl'
+    assert zerionPy.cli._resumePoint(str(path), block_size) == (0, None)
+
+    path.write_bytes(b'{"id": 1')
+    assert zerionPy.cli._resumePoint(str(path), block_size) == (0, None)
+    assert path.read_bytes() == b''
+
+    path.write_bytes(b'{"id": 1}\n{"id": 22, "name": "a"}\n{"id": 3')
+    assert zerionPy.cli._resumePoint(str(path), block_size) == (2, 22)
+    assert path.read_bytes() == b'{"id": 1}\n{"id": 22, "name": "a"}\n'
+
+def test_import_requires_resume_for_existing_journal(api, tmp_path, capsys):
+    path = tmp_path / 'records.jsonl'
+    path.write_text('\n'.join(json.dumps({'status': 'new'}) for _ in range(5)))
+
+    assert zerionPy.cli.main(['--quiet', 'import', '1', '2', str(path), '--chunk-size', '2']) == 0
+    assert len(api.posts) == 3
+    assert json.loads(capsys.readouterr().out)['written'] == 3
+
+    assert zerionPy.cli.main(['--quiet', 'import', '1', '2', str(path)]) == 1
+    assert zerionPy.cli.main(['--quiet', 'import', '1', '2', str(path), '--chunk-size', '2', '--resume']) == 0
+    assert len(api.posts) == 3
+
+def test_options_sync_csv(api, tmp_path, capsys):
+    path = tmp_path / 'states.csv'
+    path.write_text('key_value,label,sort_order\nca,California,0\nny,New York,1\n')
+
+    assert zerionPy.cli.main(['--quiet', 'options-sync', '1', f'7={path}']) == 0
+    assert api.option_writes == [('post', 7, [{'key_value': 'ny', 'label': 'New York', 'sort_order': 1}])]
+    assert json.loads(capsys.readouterr().out) == {'7': {'inserted': 1, 'updated': 0, 'deleted': 0, 'unchanged': 1}}
+
+def test_purge_needs_yes(api, capsys):
+    assert zerionPy.cli.main(['--quiet', 'purge', '1', '2', '3', '--filter', 'status(="open")']) == 0
+    assert api.deletes == []
+    assert json.loads(capsys.readouterr().out)['2']['count'] == 2500
+
+    assert zerionPy.cli.main(['--quiet', 'purge', '1', '2', '--filter', 'status(="open")', '--yes']) == 0
+    assert len(api.deletes) == 3
+
+def test_progress_output():
+    class Stream():
+        text = ''
+        def write(self, text):
+            self.text += text
+        def flush(self):
+            pass
+
+    stream = Stream()
+    progress = zerionPy.cli.Progress('export', 10, interval=0, stream=stream)
+    progress.update(4)
+    progress.finish()
+
+    assert stream.text.startswith('\rexport: 4/10 (')
+    assert stream.text.endswith('s)\n')
+
+def test_export_keyset_resume(api, tmp_path):
+    path = tmp_path / 'records.jsonl'
+    path.write_text(''.join(json.dumps(api.records[i]) + '\n' for i in range(1, 1501)) + '{"id": 15')
+
+    # records added after the interrupted run shift offsets but not the id cursor
+    api.records.update({i: {'id': i, 'status': 'new'} for i in range(5001, 5011)})
+    del api.records[3]
+
+    assert zerionPy.cli.main(['--quiet', 'export', '1', '2', '-o', str(path), '--keyset', '--resume']) == 0
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r['id'] for r in records] == list(range(1, 2501)) + list(range(5001, 5011))
@@ -0,0 +1,66 @@
+import zerionPy
+import threading
+import time
+import pytest
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        zerionPy.AdaptiveConcurrency(initial=10, maximum=5)
+
+def test_additive_increase():
+    controller = zerionPy.AdaptiveConcurrency(initial=2, maximum=4)
+    for _ in range(2):
+        controller.acquire()
+        controller.release(0.1, 200)
+    assert controller.getLimit() == 3
+
+    for _ in range(10):
+        controller.acquire()
+        controller.release(0.1, 200)
+    assert controller.getLimit() == 4
+
+def test_multiplicative_decrease_once_per_window():
+    controller = zerionPy.AdaptiveConcurrency(initial=8)
+    for _ in range(8):
+        controller.acquire()
+    time.sleep(0.01)
+    for _ in range(8):
+        controller.release(0.01, 429)
+
+    assert controller.getLimit() == 4
+    assert controller.getStats()['decreases'] == 1
+
+def test_latency_target():
+    controller = zerionPy.AdaptiveConcurrency(initial=4, latency_target=0.5)
+    controller.acquire()
+    controller.release(2.0, 200)
+    assert controller.getLimit() == 2
+
+def test_limits_in_flight():
+    controller = zerionPy.AdaptiveConcurrency(initial=2, maximum=2)
+    peak = []
+    lock = threading.Lock()
+    active = [0]
+
+    def work():
+        with controller:
+            with lock:
+                active[0] += 1
+                peak.append(active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert max(peak) == 2
+    assert controller.getStats()['in_flight'] == 0
+
+def test_client_stats():
+    controller = zerionPy.AdaptiveConcurrency(initial=3)
+    api = zerionPy.IFB('server', 'us', 'client_key', 'client_secret', 8, concurrency=controller)
+    assert api.getStats()['concurrency']['limit'] == 3
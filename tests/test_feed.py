@@ -0,0 +1,115 @@
+import zerionPy
+import asyncio
+import pytest
+
+class FeedApi():
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.params = []
+
+    def getPageFeed(self, profile_id, page_id, params=None):
+        self.params.append(params)
+        return zerionPy.ifb.ifbResponse({}, 200, self.batches.pop(0) if self.batches else [])
+
+def test_invalid_intervals():
+    with pytest.raises(ValueError):
+        zerionPy.FeedFollower(FeedApi([]), 1, 2, min_interval=5, max_interval=1)
+
+def test_poll_adapts_interval():
+    api = FeedApi([[{'id': 1}, {'id': 2}], [], [], [{'id': 2}, {'id': 3}]])
+    follower = zerionPy.FeedFollower(api, 1, 2, min_interval=1, max_interval=3)
+
+    assert follower.poll() == [{'id': 1}, {'id': 2}]
+    assert follower.getInterval() == 1
+    assert follower.poll() == []
+    assert follower.getInterval() == 2
+    assert follower.poll() == []
+    assert follower.getInterval() == 3
+    assert follower.poll() == [{'id': 3}]
+    assert follower.getInterval() == 1
+
+    assert api.params[0] == {}
+    assert api.params[1] == {'since_id': 2}
+
+def test_cursor_persists(tmp_path):
+    path = str(tmp_path / 'cursor.json')
+    follower = zerionPy.FeedFollower(FeedApi([[{'id': 7}]]), 1, 2, cursor_path=path)
+    assert follower.poll() == [{'id': 7}]
+    assert follower.getCursor() is None
+    follower.setCursor(7)
+
+    api = FeedApi([])
+    follower = zerionPy.FeedFollower(api, 1, 2, cursor_path=path)
+    assert follower.getCursor() == 7
+    follower.poll()
+    assert api.params == [{'since_id': 7}]
+
+def test_follow_saves_cursor_after_each_entry(tmp_path):
+    path = str(tmp_path / 'cursor.json')
+    follower = zerionPy.FeedFollower(FeedApi([[{'id': 9}, {'id': 7}, {'id': 8}]]), 1, 2, cursor_path=path)
+
+    # the consumer crashes while handling entry 8
+    for entry in follower.follow():
+        if entry['id'] == 8:
+            break
+
+    api = FeedApi([[{'id': 8}, {'id': 9}]])
+    follower = zerionPy.FeedFollower(api, 1, 2, cursor_path=path)
+    assert follower.getCursor() == 7
+    assert follower.poll() == [{'id': 8}, {'id': 9}]
+    assert api.params == [{'since_id': 7}]
+
+def test_follow():
+    follower = zerionPy.FeedFollower(FeedApi([[{'id': 1}], [{'id': 2}]]), 1, 2, min_interval=0.01, max_interval=0.01)
+
+    entries = []
+    for entry in follower.follow():
+        entries.append(entry)
+        if len(entries) == 2:
+            follower.stop()
+    assert entries == [{'id': 1}, {'id': 2}]
+
+def test_stop_takes_effect_mid_batch(tmp_path):
+    path = str(tmp_path / 'cursor.json')
+    api = FeedApi([[{'id': 1}, {'id': 2}, {'id': 3}], [{'id': 3}]])
+    follower = zerionPy.FeedFollower(api, 1, 2, cursor_path=path, min_interval=0.01, max_interval=0.01)
+
+    entries = []
+    for entry in follower.follow():
+        entries.append(entry)
+        if entry['id'] == 2:
+            follower.stop()
+
+    assert entries == [{'id': 1}, {'id': 2}]
+    assert follower.getCursor() == 2
+    assert zerionPy.FeedFollower(api, 1, 2, cursor_path=path).getCursor() == 2
+
+    # the entry left in the stopped batch is fetched again
+    assert follower.poll() == [{'id': 3}]
+    assert api.params[-1] == {'since_id': 2}
+
+def test_afollow():
+    follower = zerionPy.FeedFollower(FeedApi([[{'id': 1}], [], [{'id': 2}]]), 1, 2, min_interval=0.01, max_interval=0.02)
+
+    async def collect():
+        entries = []
+        async for entry in follower.afollow():
+            entries.append(entry)
+            if len(entries) == 2:
+                follower.stop()
+        return entries
+
+    assert asyncio.run(collect()) == [{'id': 1}, {'id': 2}]
+
+def test_afollow_stops_mid_batch():
+    follower = zerionPy.FeedFollower(FeedApi([[{'id': 1}, {'id': 2}]]), 1, 2, min_interval=0.01, max_interval=0.01)
+
+    async def collect():
+        entries = []
+        async for entry in follower.afollow():
+            entries.append(entry)
+            follower.stop()
+        return entries
+
+    assert asyncio.run(collect()) == [{'id': 1}]
+    assert follower.getCursor() == 1
@@ -0,0 +1,49 @@
+import zerionPy
+
+SCHEMA = {
+    'page_id': 1,
+    'name': 'inspection',
+    'multi_select': ['hazards'],
+    'subforms': {
+        'items': {'page_id': 2, 'name': 'inspection_item', 'multi_select': [], 'subforms': {}},
+    },
+}
+
+def record(i):
+    return {
+        'id': i,
+        'site': f'site {i}',
+        'hazards': 'fire,flood',
+        'location': {'latitude': 1.5, 'longitude': 2.5},
+        'items': [{'id': i * 10, 'qty': 1}, {'id': i * 10 + 1, 'qty': 2}],
+    }
+
+def test_build_schema():
+    class SchemaApi():
+        def getPage(self, profile_id, page_id):
+            return zerionPy.ifb.ifbResponse({}, 200, {'id': page_id, 'name': SCHEMA['name'] if page_id == 1 else 'inspection_item'})
+
+        def getElements(self, profile_id, page_id, params=None):
+            elements = {
+                1: [{'id': 1, 'name': 'hazards', 'data_type': 9, 'data_size': 0}, {'id': 2, 'name': 'items', 'data_type': 18, 'data_size': 2}],
+                2: [{'id': 3, 'name': 'qty', 'data_type': 2, 'data_size': 0}],
+            }
+            return zerionPy.ifb.ifbResponse({}, 200, elements[page_id] if params['offset'] == 0 else [])
+
+    assert zerionPy.buildSchema(SchemaApi(), 1, 1) == SCHEMA
+
+def test_flatten_record():
+    tables = zerionPy.RecordFlattener(SCHEMA).flatten([record(1)])
+
+    assert tables['inspection'] == [{'id': 1, 'site': 'site 1', 'hazards': 'fire,flood', 'location_latitude': 1.5, 'location_longitude': 2.5}]
+    assert tables['inspection_hazards'] == [{'record_id': 1, 'value': 'fire'}, {'record_id': 1, 'value': 'flood'}]
+    assert tables['inspection_item'] == [{'parent_id': 1, 'id': 10, 'qty': 1}, {'parent_id': 1, 'id': 11, 'qty': 2}]
+
+def test_flatten_records_batches():
+    batches = list(zerionPy.flattenRecords(SCHEMA, (record(i) for i in range(25)), batch_size=10))
+    assert [len(b['inspection']) for b in batches] == [10, 10, 5]
+
+def test_flatten_records_process_pool():
+    serial = list(zerionPy.flattenRecords(SCHEMA, (record(i) for i in range(100)), batch_size=7))
+    parallel = list(zerionPy.flattenRecords(SCHEMA, (record(i) for i in range(100)), batch_size=7, workers=2))
+    assert parallel == serial
@@ -0,0 +1,94 @@
+import zerionPy
+import queue
+import time
+import threading
+import pytest
+
+class RecordingApi():
+    def __init__(self):
+        self.calls = []
+        self.gate = threading.Event()
+
+    def getRecords(self, profile_id, page_id, params=None):
+        self.gate.wait()
+        self.calls.append((profile_id, page_id, params))
+        return page_id
+
+def test_invalid_priority():
+    with zerionPy.WorkQueue(RecordingApi(), workers=1) as work:
+        with pytest.raises(ValueError):
+            work.submit('getRecords', 1, 2, priority=7)
+
+def test_submit_returns_future():
+    api = RecordingApi()
+    api.gate.set()
+
+    with zerionPy.WorkQueue(api, workers=2) as work:
+        futures = [work.submit('getRecords', 1, page_id) for page_id in range(10)]
+        assert [f.result(timeout=5) for f in futures] == list(range(10))
+
+def test_priority_order():
+    api = RecordingApi()
+    work = zerionPy.WorkQueue(api, workers=1)
+
+    work.submit('getRecords', 0, 0)
+    while work.getPendingCount():
+        time.sleep(0.01)
+
+    low = work.submit('getRecords', 1, 1, priority=work.LOW)
+    normal = work.submit('getRecords', 1, 2)
+    high = work.submit('getRecords', 1, 3, priority=work.HIGH)
+
+    api.gate.set()
+    work.shutdown()
+
+    assert [c[1] for c in api.calls] == [0, 3, 2, 1]
+    assert low.result() == 1 and normal.result() == 2 and high.result() == 3
+
+def test_backpressure():
+    api = RecordingApi()
+    work = zerionPy.WorkQueue(api, workers=1, maxsize=1)
+
+    work.submit('getRecords', 0, 0)
+    while work.getPendingCount():
+        time.sleep(0.01)
+    work.submit('getRecords', 0, 1)
+
+    with pytest.raises(queue.Full):
+        work.submit('getRecords', 0, 2, block=False)
+
+    api.gate.set()
+    work.shutdown()
+
+def test_exception_propagates():
+    def fail():
+        raise ValueError('failed')
+
+    with zerionPy.WorkQueue(RecordingApi(), workers=1) as work:
+        future = work.submit(fail)
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+
+def test_submit_in_progress_finishes_before_shutdown():
+    api = RecordingApi()
+    work = zerionPy.WorkQueue(api, workers=1, maxsize=1)
+
+    work.submit('getRecords', 0, 0)
+    while work.getPendingCount():
+        time.sleep(0.01)
+    work.submit('getRecords', 0, 1)
+
+    futures = []
+    submitter = threading.Thread(target=lambda: futures.append(work.submit('getRecords', 0, 2)))
+    submitter.start()
+    time.sleep(0.05)
+
+    stopper = threading.Thread(target=work.shutdown)
+    stopper.start()
+    time.sleep(0.05)
+
+    api.gate.set()
+    submitter.join(5)
+    stopper.join(5)
+
+    assert futures[0].result(timeout=5) == 2
@@ -0,0 +1,127 @@
+import zerionPy
+import pytest
+from fakes import response
+
+class RecordApi():
+    def __init__(self, fail_after=None):
+        self.records = {}
+        self.posts = []
+        self.puts = []
+        self.fail_after = fail_after
+
+    def postRecords(self, profile_id, page_id, body):
+        ids = []
+        for record in body:
+            record_id = len(self.records) + 1
+            self.records[record_id] = dict(record, id=record_id)
+            ids.append({'id': record_id})
+        self.posts.append(body)
+
+        # the server stored the chunk but the response never arrived
+        if self.fail_after is not None and len(self.posts) > self.fail_after:
+            raise ConnectionError("connection reset")
+        return response(ids, 201)
+
+    def putRecords(self, profile_id, page_id, body, params=None):
+        self.puts.append(body)
+        return response([{'id': record['id']} for record in body])
+
+    def getRecords(self, profile_id, page_id, params=None):
+        field, values = params['fields'].split('(', 1)
+        return response([r for r in self.records.values() if f'(="{r.get(field)}")' in values])
+
+def test_post_resume_skips_committed_chunks(tmp_path):
+    records = [{'external_id': f'r{i}'} for i in range(5)]
+    api = RecordApi()
+
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        report = zerionPy.BulkWriter(api, 1, 2, journal, chunk_size=2).postRecords(records)
+
+    assert report['written'] == 3
+    assert report['ids'] == [1, 2, 3, 4, 5]
+
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        report = zerionPy.BulkWriter(api, 1, 2, journal, chunk_size=2).postRecords(records)
+
+    assert report['written'] == 0 and report['skipped'] == 3
+    assert report['ids'] == [1, 2, 3, 4, 5]
+    assert len(api.posts) == 3
+
+def test_in_doubt_post_is_rechecked(tmp_path):
+    records = [{'external_id': f'r{i}'} for i in range(4)]
+    api = RecordApi(fail_after=1)
+
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        with pytest.raises(ConnectionError):
+            zerionPy.BulkWriter(api, 1, 2, journal, chunk_size=2, key_field='external_id').postRecords(records)
+        assert len(journal.getInDoubt()) == 1
+
+    api.fail_after = None
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        report = zerionPy.BulkWriter(api, 1, 2, journal, chunk_size=2, key_field='external_id').postRecords(records)
+        assert journal.getInDoubt() == []
+
+    assert report['skipped'] == 1 and report['rechecked'] == 1
+    assert len(api.records) == 4
+    assert sorted(report['ids']) == [1, 2, 3, 4]
+
+def test_in_doubt_post_without_key_is_not_reposted(tmp_path):
+    records = [{'external_id': f'r{i}'} for i in range(2)]
+    api = RecordApi(fail_after=0)
+
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        with pytest.raises(ConnectionError):
+            zerionPy.BulkWriter(api, 1, 2, journal).postRecords(records)
+
+    api.fail_after = None
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        report = zerionPy.BulkWriter(api, 1, 2, journal).postRecords(records)
+
+    assert len(report['in_doubt']) == 1
+    assert len(api.records) == 2
+
+def test_rejected_chunk_is_retried(tmp_path):
+    api = RecordApi()
+    api.postRecords = lambda profile_id, page_id, body: response({'error': 'invalid'}, 400)
+
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        with pytest.raises(zerionPy.ResponseError):
+            zerionPy.BulkWriter(api, 1, 2, journal).postRecords([{'external_id': 'r0'}])
+        assert journal.getInDoubt() == []
+
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        report = zerionPy.BulkWriter(RecordApi(), 1, 2, journal).postRecords([{'external_id': 'r0'}])
+
+    assert report['written'] == 1
+
+def test_put_resume(tmp_path):
+    records = [{'id': i, 'status': 'done'} for i in range(1, 6)]
+    api = RecordApi()
+
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        zerionPy.BulkWriter(api, 1, 2, journal, chunk_size=2).putRecords(records[:4])
+
+    with zerionPy.WriteJournal(str(tmp_path / 'load.journal')) as journal:
+        report = zerionPy.BulkWriter(api, 1, 2, journal, chunk_size=2).putRecords(records)
+
+    assert report['skipped'] == 2 and report['written'] == 1
+    assert api.puts[-1] == [records[4]]
+
+def test_torn_line_is_ignored(tmp_path):
+    path = tmp_path / 'load.journal'
+
+    with zerionPy.WriteJournal(str(path)) as journal:
+        journal.recordIntent('post:0:abc', 'post', 2)
+        journal.recordCommit('post:0:abc', [1, 2])
+
+    with open(path, 'a') as f:
+        f.write('{"event":"intent","key":"post:1')
+
+    with zerionPy.WriteJournal(str(path)) as journal:
+        journal.recordIntent('post:2:ghi', 'post', 1)
+
+    with zerionPy.WriteJournal(str(path)) as journal:
+        assert journal.getState('post:0:abc') == zerionPy.WriteJournal.COMMITTED
+        assert journal.getState('post:2:ghi') == zerionPy.WriteJournal.IN_DOUBT
+        assert journal.getIds('post:0:abc') == [1, 2]
+        assert journal.getState('post:1:def') is None
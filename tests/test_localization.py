@@ -0,0 +1,74 @@
+import zerionPy
+import json
+import threading
+from fakes import response
+
+class LocalizationApi():
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.writes = []
+        self.localizations = {
+            ('Page', (1,)): [{'language_code': 'es', 'label': 'Inspección'}, {'language_code': 'fr', 'label': 'Inspection'}],
+            ('Page', (2,)): [],
+            ('Element', (1, 11)): [{'language_code': 'es', 'label': 'Estado'}],
+            ('Element', (1, 12)): [],
+            ('Element', (2, 21)): [{'language_code': 'es', 'label': 'Cantidad'}],
+            ('Option', (5, 51)): [{'language_code': 'es', 'label': 'California'}],
+        }
+
+    def getElements(self, profile_id, page_id, params=None):
+        elements = {1: [{'id': 11, 'data_type': 7, 'optionlist_id': 5}, {'id': 12, 'data_type': 18, 'data_size': 2}], 2: [{'id': 21, 'data_type': 2}]}
+        return response(elements[page_id] if params['offset'] == 0 else [])
+
+    def getOptions(self, profile_id, optionlist_id, params=None):
+        return response([{'id': 51, 'key_value': 'ca'}] if params['offset'] == 0 else [])
+
+    def __getattr__(self, name):
+        for resource in ('Page', 'Element', 'Option'):
+            for verb in ('get', 'post', 'put'):
+                if name == f'{verb}{resource}Localizations':
+                    return lambda profile_id, *args, v=verb, r=resource, **kwargs: self.handle(v, r, args + tuple(kwargs.values()))
+        raise AttributeError(name)
+
+    def handle(self, verb, resource, args):
+        if verb == 'get':
+            *ids, params = args
+            return response(self.localizations[(resource, tuple(ids))] if params['offset'] == 0 else [])
+
+        ids = args[:-2] if verb == 'put' else args[:-1]
+        body = args[-2] if verb == 'put' else args[-1]
+        with self.lock:
+            self.writes.append((verb, resource, tuple(ids), body))
+        return response([], 201)
+
+def test_export_localizations(tmp_path):
+    paths = zerionPy.exportLocalizations(LocalizationApi(), 100, 1, str(tmp_path), workers=4)
+    assert set(paths) == {'es', 'fr'}
+
+    with open(paths['es'], encoding='utf-8') as f:
+        pack = json.load(f)
+
+    assert pack['pages'] == {'1': {'label': 'Inspección'}}
+    assert pack['elements'] == {'1/11': {'label': 'Estado'}, '2/21': {'label': 'Cantidad'}}
+    assert pack['options'] == {'5/51': {'label': 'California'}}
+
+def test_import_localizations(tmp_path):
+    api = LocalizationApi()
+    paths = zerionPy.exportLocalizations(api, 100, 1, str(tmp_path))
+
+    assert zerionPy.importLocalizations(api, 100, list(paths.values())) == {'inserted': 0, 'updated': 0, 'unchanged': 5}
+    assert api.writes == []
+
+    with open(paths['es'], encoding='utf-8') as f:
+        pack = json.load(f)
+    pack['elements']['1/11']['label'] = 'Estado nuevo'
+    pack['elements']['1/12'] = {'label': 'Artículos'}
+    with open(paths['es'], 'w', encoding='utf-8') as f:
+        json.dump(pack, f)
+
+    report = zerionPy.importLocalizations(api, 100, paths['es'])
+    assert report == {'inserted': 1, 'updated': 1, 'unchanged': 3}
+    assert sorted(api.writes) == [
+        ('post', 'Element', (1, 12), [{'language_code': 'es', 'label': 'Artículos'}]),
+        ('put', 'Element', (1, 11), [{'language_code': 'es', 'label': 'Estado nuevo'}]),
+    ]
@@ -0,0 +1,178 @@
+import zerionPy
+import zerionPy.utils
+import itertools
+import threading
+import pytest
+from fakes import response
+
+class SourceApi():
+    pages = {1: {'id': 1, 'name': 'parent', 'label': 'Parent', 'version': 3}, 2: {'id': 2, 'name': 'child', 'label': 'Child'}}
+    elements = {
+        1: [{'id': 11, 'name': 'state', 'data_type': 7, 'optionlist_id': 5, 'sort_order': 0}, {'id': 12, 'name': 'items', 'data_type': 18, 'data_size': 2, 'sort_order': 1}],
+        2: [{'id': 21, 'name': 'qty', 'data_type': 2, 'sort_order': 0}],
+    }
+
+    def getPage(self, profile_id, page_id):
+        return response(self.pages[page_id])
+
+    def getElements(self, profile_id, page_id, params=None):
+        return response(self.elements[page_id] if params['offset'] == 0 else [])
+
+    def getOptionList(self, profile_id, optionlist_id):
+        return response({'id': optionlist_id, 'name': 'states'})
+
+    def getOptions(self, profile_id, optionlist_id, params=None):
+        return response([{'id': 51, 'key_value': 'ca', 'label': 'California'}] if params['offset'] == 0 else [])
+
+    def getPageLocalizations(self, profile_id, page_id, params=None):
+        return response([{'id': 3, 'language_code': 'es', 'label': 'Padre'}] if page_id == 1 and params['offset'] == 0 else [])
+
+    def getElementLocalizations(self, profile_id, page_id, element_id, params=None):
+        return response([{'id': 4, 'language_code': 'es', 'label': 'Estado'}] if element_id == 11 and params['offset'] == 0 else [])
+
+    def getOptionLocalizations(self, profile_id, optionlist_id, option_id, params=None):
+        return response([{'id': 1, 'language_code': 'es', 'label': 'California'}] if params['offset'] == 0 else [])
+
+    def getPageDynamicAttributes(self, profile_id, page_id, params=None):
+        return response([])
+
+    def getElementDynamicAttributes(self, profile_id, page_id, element_id, params=None):
+        return response([{'id': 6, 'name': 'color', 'value': 'red'}] if element_id == 21 and params['offset'] == 0 else [])
+
+class TargetApi():
+    def __init__(self):
+        self.ids = itertools.count(100)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def record(self, *call):
+        with self.lock:
+            self.calls.append(call)
+
+    def getOptionLists(self, profile_id, params=None):
+        return response([])
+
+    def postOptionLists(self, profile_id, body):
+        self.record('postOptionLists', body)
+        return response({'id': next(self.ids)}, 201)
+
+    def postOptions(self, profile_id, optionlist_id, body):
+        self.record('postOptions', optionlist_id, body)
+        return response([{'id': next(self.ids)} for _ in body], 201)
+
+    def postPages(self, profile_id, body):
+        self.record('postPages', body)
+        return response({'id': next(self.ids)}, 201)
+
+    def postOptionLocalizations(self, profile_id, optionlist_id, option_id, body):
+        self.record('postOptionLocalizations', optionlist_id, option_id, body)
+        return response([], 201)
+
+    def postPageLocalizations(self, profile_id, page_id, body):
+        self.record('postPageLocalizations', page_id, body)
+        return response([], 201)
+
+    def postElementLocalizations(self, profile_id, page_id, element_id, body):
+        self.record('postElementLocalizations', page_id, element_id, body)
+        return response([], 201)
+
+    def postElements(self, profile_id, page_id, body):
+        self.record('postElements', page_id, body)
+        return response([{'id': next(self.ids)} for _ in body], 201)
+
+    def postElementDynamicAttributes(self, profile_id, page_id, element_id, body):
+        self.record('postElementDynamicAttributes', page_id, element_id, body)
+        return response([], 201)
+
+def test_run_graph_order():
+    order = []
+    tasks = {
+        'a': (lambda: order.append('a'), ('b', 'c')),
+        'b': (lambda: order.append('b'), ('c',)),
+        'c': (lambda: order.append('c'), ()),
+    }
+    zerionPy.utils.runGraph(tasks, workers=4)
+    assert order == ['c', 'b', 'a']
+
+def test_run_graph_cycle():
+    with pytest.raises(ValueError):
+        zerionPy.utils.runGraph({'a': (lambda: None, ('b',)), 'b': (lambda: None, ('a',))})
+
+def test_migration():
+    target = TargetApi()
+    migration = zerionPy.Migration(SourceApi(), target, 1, 2, workers=4)
+
+    snapshot = migration.takeSnapshot([1])
+    assert set(snapshot['pages']) == {1, 2}
+    assert set(snapshot['optionlists']) == {5}
+    assert snapshot['element_dynamic_attributes'] == {21: [{'id': 6, 'name': 'color', 'value': 'red'}]}
+
+    id_map = migration.run()
+    assert set(id_map['pages']) == {1, 2}
+    assert set(id_map['elements']) == {11, 12, 21}
+
+    posted = {call[1]: call[2] for call in target.calls if call[0] == 'postElements'}
+    parent = posted[id_map['pages'][1]]
+    assert parent[0]['optionlist_id'] == id_map['optionlists'][5]
+    assert parent[1]['data_size'] == id_map['pages'][2]
+    assert 'id' not in parent[0]
+
+    pages = [call[1] for call in target.calls if call[0] == 'postPages']
+    assert all('version' not in page for page in pages)
+
+    # source ids of localizations and dynamic attributes are not sent to the target
+    extras = [call for call in target.calls if call[0].endswith(('Localizations', 'DynamicAttributes'))]
+    assert sorted(extras) == sorted([
+        ('postOptionLocalizations', id_map['optionlists'][5], id_map['options'][51], [{'language_code': 'es', 'label': 'California'}]),
+        ('postPageLocalizations', id_map['pages'][1], [{'language_code': 'es', 'label': 'Padre'}]),
+        ('postElementLocalizations', id_map['pages'][1], id_map['elements'][11], [{'language_code': 'es', 'label': 'Estado'}]),
+        ('postElementDynamicAttributes', id_map['pages'][2], id_map['elements'][21], [{'name': 'color', 'value': 'red'}]),
+    ])
+
+class ExistingListTargetApi(TargetApi):
+    def __init__(self):
+        super().__init__()
+        self.options = [{'id': 900, 'key_value': 'ny', 'label': 'New York'}]
+
+    def getOptionLists(self, profile_id, params=None):
+        return response([{'id': 800, 'name': 'states'}] if params['offset'] == 0 else [])
+
+    def getOptions(self, profile_id, optionlist_id, params=None):
+        return response(list(self.options) if params['offset'] == 0 else [])
+
+    def postOptions(self, profile_id, optionlist_id, body):
+        self.record('postOptions', optionlist_id, body)
+        created = [dict(option, id=next(self.ids)) for option in body]
+        self.options.extend(created)
+        return response([{'id': o['id']} for o in created], 201)
+
+    def deleteOptions(self, profile_id, optionlist_id, params=None):
+        self.record('deleteOptions', optionlist_id, params)
+        return response([])
+
+    def getOptionLocalizations(self, profile_id, optionlist_id, option_id, params=None):
+        return response([])
+
+    def postOptionLocalizations(self, profile_id, optionlist_id, option_id, body):
+        self.record('postOptionLocalizations', optionlist_id, option_id, body)
+        return response([], 201)
+
+def test_migration_reuses_option_list_by_name():
+    target = ExistingListTargetApi()
+    id_map = zerionPy.Migration(SourceApi(), target, 1, 2, reuse_optionlists=True).run([1])
+
+    assert id_map['optionlists'] == {5: 800}
+    ca = next(o['id'] for o in target.options if o['key_value'] == 'ca')
+    assert id_map['options'] == {51: ca}
+
+    names = [call[0] for call in target.calls]
+    assert 'postOptionLists' not in names and 'deleteOptions' not in names
+    assert [o['key_value'] for o in target.options] == ['ny', 'ca']
+    assert ('postOptionLocalizations', 800, ca, [{'language_code': 'es', 'label': 'California'}]) in target.calls
+
+def test_migration_does_not_reuse_by_default():
+    target = ExistingListTargetApi()
+    id_map = zerionPy.Migration(SourceApi(), target, 1, 2).run([1])
+
+    assert id_map['optionlists'][5] != 800
+    assert [call[0] for call in target.calls].count('postOptionLists') == 1
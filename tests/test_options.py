@@ -0,0 +1,77 @@
+import zerionPy
+import pytest
+
+class OptionsApi():
+    def __init__(self, options):
+        self.options = options
+        self.calls = []
+
+    def getOptions(self, profile_id, optionlist_id, params=None):
+        self.calls.append(('get', params))
+        return zerionPy.ifb.ifbResponse({}, 200, self.options[params['offset']:params['offset'] + params['limit']])
+
+    def postOptions(self, profile_id, optionlist_id, body):
+        self.calls.append(('post', body))
+        return zerionPy.ifb.ifbResponse({}, 201, [{'id': i} for i in range(len(body))])
+
+    def putOptions(self, profile_id, optionlist_id, body, params=None):
+        self.calls.append(('put', body, params))
+        return zerionPy.ifb.ifbResponse({}, 200, body)
+
+    def deleteOptions(self, profile_id, optionlist_id, params=None):
+        self.calls.append(('delete', params))
+        return zerionPy.ifb.ifbResponse({}, 200, [])
+
+def test_diff_options():
+    current = [
+        {'id': 1, 'key_value': 'a', 'label': 'A', 'sort_order': 0},
+        {'id': 2, 'key_value': 'b', 'label': 'B', 'sort_order': 1},
+        {'id': 3, 'key_value': 'c', 'label': 'C', 'sort_order': 2},
+    ]
+    desired = [
+        {'key_value': 'a', 'label': 'A'},
+        {'key_value': 'b', 'label': 'Bee', 'sort_order': 1},
+        {'key_value': 'd', 'label': 'D'},
+    ]
+
+    inserts, updates, deletes = zerionPy.diffOptions(current, desired)
+    assert inserts == [{'key_value': 'd', 'label': 'D'}]
+    assert updates == [{'id': 2, 'label': 'Bee'}]
+    assert deletes == [3]
+
+    assert zerionPy.diffOptions(current, desired, delete_missing=False)[2] == []
+
+def test_diff_options_duplicate_key():
+    with pytest.raises(ValueError):
+        zerionPy.diffOptions([], [{'key_value': 'a'}, {'key_value': 'a'}])
+
+def test_sync_options_steady_state():
+    options = [{'id': i, 'key_value': str(i), 'label': str(i)} for i in range(2500)]
+    api = OptionsApi(options)
+
+    report = zerionPy.syncOptions(api, 1, 2, [{'key_value': o['key_value'], 'label': o['label']} for o in options])
+    assert report['unchanged'] == 2500
+    assert [c[0] for c in api.calls] == ['get', 'get', 'get']
+    assert api.calls[0][1]['fields'] == 'key_value,label'
+
+def test_sync_options_batches():
+    options = [{'id': i, 'key_value': str(i), 'label': str(i)} for i in range(300)]
+    api = OptionsApi(options)
+    desired = [{'key_value': str(i), 'label': f'new {i}' if i < 150 else str(i)} for i in range(50, 300)]
+    desired += [{'key_value': f'x{i}', 'label': 'x'} for i in range(1500)]
+
+    report = zerionPy.syncOptions(api, 1, 2, desired)
+    assert len(report['inserted']) == 1500
+    assert len(report['updated']) == 100
+    assert len(report['deleted']) == 50
+
+    methods = [c[0] for c in api.calls]
+    assert methods == ['get', 'post', 'post', 'put', 'delete']
+    assert api.calls[3][2]['fields'].startswith('id((="50")|(="51")')
+    assert api.calls[4][1]['limit'] == 50
+
+def test_sync_options_dry_run():
+    api = OptionsApi([{'id': 1, 'key_value': 'a', 'label': 'A'}])
+    report = zerionPy.syncOptions(api, 1, 2, [], dry_run=True)
+    assert report['deleted'] == [1]
+    assert [c[0] for c in api.calls] == ['get']
@@ -0,0 +1,65 @@
+import zerionPy
+import multiprocessing
+import pytest
+
+def recordCalls(path, calls):
+    ledger = zerionPy.QuotaLedger(path)
+    for _ in range(calls):
+        ledger.record('server', 'export')
+
+def test_invalid_budget(tmp_path):
+    ledger = zerionPy.QuotaLedger(str(tmp_path / 'quota.db'))
+    with pytest.raises(ValueError):
+        ledger.setBudget('server', 10, soft_limit=20)
+
+def test_quota_usage_and_remaining(tmp_path):
+    ledger = zerionPy.QuotaLedger(str(tmp_path / 'quota.db'))
+    assert ledger.getRemaining('server') is None
+
+    ledger.setBudget('server', 10)
+    ledger.setBudget('server', 3, job='export')
+    ledger.record('server', 'export', 2)
+    ledger.record('server', calls=4)
+
+    assert ledger.getUsage('server') == 6
+    assert ledger.getUsage('server', 'export') == 2
+    assert ledger.getRemaining('server') == 4
+    assert ledger.getRemaining('server', 'export') == 1
+
+def test_quota_hard_limit(tmp_path):
+    ledger = zerionPy.QuotaLedger(str(tmp_path / 'quota.db'))
+    ledger.setBudget('server', 2)
+
+    ledger.acquire('server', priority='high')
+    ledger.acquire('server', priority='high')
+    with pytest.raises(zerionPy.QuotaExceededError):
+        ledger.acquire('server', priority='high')
+
+    assert ledger.getUsage('server') == 2
+
+def test_quota_soft_limit(tmp_path):
+    ledger = zerionPy.QuotaLedger(str(tmp_path / 'quota.db'), throttle_delay=0)
+    ledger.setBudget('server', 10, soft_limit=1)
+    ledger.setBudget('server', 10, soft_limit=1, job='export', soft_action='throttle')
+
+    ledger.acquire('server', priority='low')
+    with pytest.raises(zerionPy.QuotaExceededError):
+        ledger.acquire('server', priority='low')
+    ledger.acquire('server', priority='normal')
+
+    ledger.setBudget('server', 10)
+    ledger.acquire('server', 'export', priority='low')
+    ledger.acquire('server', 'export', priority='low')
+    assert ledger.getUsage('server', 'export') == 2
+
+def test_quota_shared_across_processes(tmp_path):
+    path = str(tmp_path / 'quota.db')
+    zerionPy.QuotaLedger(path)
+
+    processes = [multiprocessing.Process(target=recordCalls, args=(path, 25)) for _ in range(4)]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+
+    assert zerionPy.QuotaLedger(path).getUsage('server', 'export') == 100
@@ -0,0 +1,67 @@
+import zerionPy
+import multiprocessing
+import time
+import pytest
+from fakes import FakeResult, FakeSession, connect
+
+def acquirePermits(path, count, results):
+    limiter = zerionPy.SharedRateLimiter(path, rate=50)
+    for _ in range(count):
+        limiter.acquire('server')
+        results.put(time.time())
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        zerionPy.SharedRateLimiter(rate=0)
+
+def test_reserve_spaces_permits(tmp_path):
+    limiter = zerionPy.SharedRateLimiter(str(tmp_path / 'rate.db'), rate=10)
+    delays = [limiter.reserve('server') for _ in range(5)]
+
+    assert delays[0] == 0
+    assert delays[4] == pytest.approx(0.4, abs=0.05)
+    assert limiter.reserve('other') == 0
+
+def test_burst(tmp_path):
+    limiter = zerionPy.SharedRateLimiter(str(tmp_path / 'rate.db'), rate=10, burst=3)
+    delays = [limiter.reserve('server') for _ in range(4)]
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.1, abs=0.05)
+
+def test_penalize(tmp_path):
+    limiter = zerionPy.SharedRateLimiter(str(tmp_path / 'rate.db'), rate=10)
+    limiter.penalize('server', 2)
+    assert limiter.reserve('server') == pytest.approx(2, abs=0.05)
+
+def test_shared_across_processes(tmp_path):
+    path = str(tmp_path / 'rate.db')
+    zerionPy.SharedRateLimiter(path, rate=50)
+    results = multiprocessing.Queue()
+
+    processes = [multiprocessing.Process(target=acquirePermits, args=(path, 10, results)) for _ in range(4)]
+    start = time.time()
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+
+    times = sorted(results.get() for _ in range(40))
+    assert times[-1] - start >= 39 / 50 * 0.9
+
+def test_rate_limited_request_penalizes_shared_limiter(tmp_path, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+    path = str(tmp_path / 'rate.db')
+    session = FakeSession([FakeResult(429, headers={'Retry-After': '5'}), FakeResult(200, [{'id': 1}])])
+    api = connect(session, rate_limiter=zerionPy.SharedRateLimiter(path, rate=10))
+
+    assert api.getProfiles().response == [{'id': 1}]
+    assert session.calls == 2
+
+    # the retry waited out Retry-After on the shared permits instead of sleeping 60 seconds
+    assert len(sleeps) == 1 and sleeps[0] == pytest.approx(5, abs=0.5)
+
+    # other processes sharing the database are held back as well
+    other = zerionPy.SharedRateLimiter(path, rate=10)
+    assert other.reserve(api._IFB__host) == pytest.approx(5.1, abs=0.5)
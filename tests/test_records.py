@@ -0,0 +1,65 @@
+import zerionPy
+import re
+import pytest
+from fakes import response
+
+class RecordsApi():
+    def __init__(self, ids):
+        self.ids = sorted(ids)
+        self.calls = []
+
+    def matching(self, fields):
+        ids = self.ids
+        lower = re.search(r'\(>"(\d+)"\)', fields)
+        upper = re.search(r'\(<="(\d+)"\)', fields)
+        if lower:
+            ids = [i for i in ids if i > int(lower.group(1))]
+        if upper:
+            ids = [i for i in ids if i <= int(upper.group(1))]
+        return ids
+
+    def getRecords(self, profile_id, page_id, params=None):
+        self.calls.append(('get', params))
+        ids = self.matching(params['fields'])
+        offset = params.get('offset', 0)
+        return response([{'id': i} for i in ids[offset:offset + params['limit']]], headers={'Total-Count': str(len(ids))})
+
+    def deleteRecords(self, profile_id, page_id, params=None):
+        self.calls.append(('delete', params))
+        ids = self.matching(params['fields'])[:params['limit']]
+        self.ids = [i for i in self.ids if i not in ids]
+        return response([{'id': i} for i in ids])
+
+    def putRecords(self, profile_id, page_id, body, params=None):
+        self.calls.append(('put', body, params))
+        return response([{'id': i} for i in self.matching(params['fields'])[:params['limit']]])
+
+def test_count_records():
+    api = RecordsApi(range(1, 2501))
+    assert zerionPy.countRecords(api, 1, 2, 'status(="closed")') == 2500
+    assert api.calls == [('get', {'fields': 'id,status(="closed")', 'limit': 1})]
+
+def test_bulk_requires_filter():
+    with pytest.raises(ValueError):
+        zerionPy.bulkDeleteRecords(RecordsApi([]), 1, 2, '')
+
+def test_bulk_delete_dry_run():
+    api = RecordsApi(range(1, 2501))
+    report = zerionPy.bulkDeleteRecords(api, 1, 2, 'status(="closed")', dry_run=True)
+    assert report == {'count': 2500, 'chunks': 3, 'affected': 0, 'dry_run': True}
+    assert len(api.ids) == 2500
+
+def test_bulk_delete_records():
+    api = RecordsApi(range(1, 2501))
+    report = zerionPy.bulkDeleteRecords(api, 1, 2, 'status(="closed")')
+    assert report['affected'] == 2500 and report['chunks'] == 3
+    assert api.ids == []
+
+    deletes = [c[1]['fields'] for c in api.calls if c[0] == 'delete']
+    assert deletes == ['id((<="1000")),status(="closed")', 'id((>"1000")&(<="2000")),status(="closed")', 'id((>"2000")),status(="closed")']
+
+def test_bulk_update_records():
+    api = RecordsApi(range(1, 1001))
+    report = zerionPy.bulkUpdateRecords(api, 1, 2, {'status': 'archived'}, 'status(="closed")', chunk_size=400)
+    assert report['affected'] == 1000 and report['chunks'] == 3
+    assert all(c[1] == {'status': 'archived'} for c in api.calls if c[0] == 'put')
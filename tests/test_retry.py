@@ -0,0 +1,176 @@
+import zerionPy
+import threading
+import time
+import pytest
+from fakes import FakeResult, FakeSession, connect
+
+def test_invalid_retry_policy():
+    with pytest.raises(ValueError):
+        zerionPy.RetryPolicy(max_retries=-1)
+
+def test_retry_idempotent_methods():
+    policy = zerionPy.RetryPolicy(max_retries=2)
+    assert policy.shouldRetry('get', 0, status_code=503)
+    assert policy.shouldRetry('delete', 1, status_code=502)
+    assert not policy.shouldRetry('get', 2, status_code=503)
+    assert not policy.shouldRetry('get', 0, status_code=400)
+
+def test_retry_skips_sent_posts():
+    policy = zerionPy.RetryPolicy()
+    assert not policy.shouldRetry('post', 0, status_code=503)
+    assert not policy.shouldRetry('post', 0, error=ConnectionError(), sent=True)
+    assert policy.shouldRetry('post', 0, error=ConnectionError(), sent=False)
+
+def test_retry_backoff_bounds():
+    policy = zerionPy.RetryPolicy(backoff_factor=1, max_backoff=10, jitter=False)
+    assert policy.getBackoff(0) == 1
+    assert policy.getBackoff(2) == 4
+    assert policy.getBackoff(10) == 10
+    assert policy.getBackoff(0, retry_after=5) == 5
+
+    policy = zerionPy.RetryPolicy(backoff_factor=1, max_backoff=10)
+    assert all(0 <= policy.getBackoff(3) <= 8 for _ in range(100))
+
+def test_circuit_breaker():
+    breaker = zerionPy.CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+    host = 'api.iformbuilder.com'
+
+    breaker.recordFailure(host)
+    assert breaker.allowRequest(host)
+
+    breaker.recordFailure(host)
+    assert breaker.getState(host) == breaker.OPEN
+    assert not breaker.allowRequest(host)
+    assert breaker.allowRequest('uk-api.iformbuilder.com')
+
+    time.sleep(0.06)
+    assert breaker.allowRequest(host)
+    assert not breaker.allowRequest(host)
+
+    breaker.recordFailure(host)
+    assert not breaker.allowRequest(host)
+
+    time.sleep(0.06)
+    assert breaker.allowRequest(host)
+    breaker.recordSuccess(host)
+    assert breaker.getState(host) == breaker.CLOSED
+
+def test_request_retries_server_errors():
+    session = FakeSession([FakeResult(503), FakeResult(200, [{'id': 1}])])
+    api = connect(session, retry_policy=zerionPy.RetryPolicy(backoff_factor=0))
+
+    assert api.getProfiles().response == [{'id': 1}]
+    assert session.calls == 2
+
+def test_request_releases_probe_on_quota_refusal(tmp_path):
+    breaker = zerionPy.CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    quota = zerionPy.QuotaLedger(str(tmp_path / 'quota.db'))
+    quota.setBudget('server', 2)
+
+    session = FakeSession([FakeResult(503), FakeResult(200, [])])
+    api = connect(session, circuit_breaker=breaker, quota=quota)
+    host = 'api.iformbuilder.com'
+
+    assert api.getProfiles().status_code == 503
+    assert breaker.getState(host) == breaker.OPEN
+
+    time.sleep(0.06)
+    quota.setBudget('server', 1)
+    with pytest.raises(zerionPy.QuotaExceededError):
+        api.getProfiles()
+    assert breaker.getState(host) == breaker.HALF_OPEN
+
+    quota.setBudget('server', 10)
+    assert api.getProfiles().status_code == 200
+    assert breaker.getState(host) == breaker.CLOSED
+
+def test_open_circuit_fails_before_quota_and_rate_limit(tmp_path):
+    breaker = zerionPy.CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    quota = zerionPy.QuotaLedger(str(tmp_path / 'quota.db'))
+    limiter = zerionPy.SharedRateLimiter(str(tmp_path / 'rate.db'), rate=1)
+
+    session = FakeSession([FakeResult(503)])
+    api = connect(session, circuit_breaker=breaker, quota=quota, rate_limiter=limiter)
+    api.getProfiles()
+
+    start = time.monotonic()
+    for _ in range(5):
+        with pytest.raises(zerionPy.CircuitOpenError):
+            api.getProfiles()
+
+    assert time.monotonic() - start < 0.5
+    assert quota.getUsage('server') == 1
+    assert api.getApiCount() == 1
+
+def test_request_releases_probe_on_unexpected_error():
+    breaker = zerionPy.CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    session = FakeSession([FakeResult(503), ValueError('bad url'), FakeResult(200, [])])
+    api = connect(session, circuit_breaker=breaker)
+
+    api.getProfiles()
+    with pytest.raises(ValueError):
+        api.getProfiles()
+
+    assert api.getProfiles().status_code == 200
+    assert breaker.getState('api.iformbuilder.com') == breaker.CLOSED
+
+class TokenResponse():
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {'access_token': 'token'}
+
+def test_first_token_request_is_thread_safe(monkeypatch):
+    import requests
+
+    class SlowSession(requests.Session):
+        def __init__(self):
+            time.sleep(0.05)
+            super().__init__()
+
+    posts = []
+    def post(url, data=None, timeout=None):
+        posts.append(url)
+        return TokenResponse()
+
+    monkeypatch.setattr(requests, 'Session', SlowSession)
+    monkeypatch.setattr(requests, 'post', post)
+    api = zerionPy.IFB('server', 'us', 'client_key', 'client_secret' * 3, 8)
+
+    errors = []
+    def getToken(delay):
+        time.sleep(delay)
+        try:
+            assert api.getAccessToken() == 'token'
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=getToken, args=(i * 0.01,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(posts) == 1
+
+def test_failed_token_request_is_not_retried_on_every_call(monkeypatch):
+    import requests
+
+    posts = []
+    def post(url, data=None, timeout=None):
+        posts.append(url)
+        raise requests.exceptions.ConnectionError('unreachable')
+
+    monkeypatch.setattr(requests, 'post', post)
+    api = zerionPy.IFB('server', 'us', 'client_key', 'client_secret' * 3, 8)
+
+    assert api.getAccessToken() is None
+    assert api.getAccessToken() is None
+    assert len(posts) == 1
+
+    # once the retry interval has passed
+    api._IFB__token_retry_at = 0
+    monkeypatch.setattr(requests, 'post', lambda url, data=None, timeout=None: TokenResponse())
+    assert api.getAccessToken() == 'token'
@@ -0,0 +1,112 @@
+import zerionPy
+import threading
+from fakes import response
+
+class ProfileApi():
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.gets = []
+        self.pages = {1: {'id': 1, 'name': 'inspection', 'version': 3, 'modified_date': '2026-10-01'}, 2: {'id': 2, 'name': 'line_item', 'version': 1, 'modified_date': '2026-09-01'}}
+        self.elements = {1: [{'id': 11, 'name': 'status'}], 2: [{'id': 21, 'name': 'quantity'}]}
+        self.endpoints = {1: [{'id': 5, 'url': 'https://example.com/hook'}], 2: []}
+        self.optionlists = {7: {'id': 7, 'name': 'states', 'version': 1, 'modified_date': '2026-08-01'}}
+        self.options = {7: [{'id': 71, 'key_value': 'ca'}]}
+        self.usergroups = {9: {'id': 9, 'name': 'inspectors'}}
+
+    def list(self, items, params):
+        return response(items if params['offset'] == 0 else [])
+
+    def get(self, kind, items, object_id):
+        with self.lock:
+            self.gets.append((kind, object_id))
+        return response(dict(items[object_id]))
+
+    def getPages(self, profile_id, params=None):
+        return self.list([{'id': p['id'], 'version': p['version'], 'modified_date': p['modified_date']} for p in self.pages.values()], params)
+
+    def getPage(self, profile_id, page_id):
+        return self.get('page', self.pages, page_id)
+
+    def getElements(self, profile_id, page_id, params=None):
+        return self.list(self.elements[page_id], params)
+
+    def getPageEndpoints(self, profile_id, page_id, params=None):
+        return self.list(self.endpoints[page_id], params)
+
+    def getPageEmailAlerts(self, profile_id, page_id, params=None):
+        return self.list([], params)
+
+    def getOptionLists(self, profile_id, params=None):
+        return self.list([{'id': o['id'], 'version': o['version'], 'modified_date': o['modified_date']} for o in self.optionlists.values()], params)
+
+    def getOptionList(self, profile_id, optionlist_id):
+        return self.get('optionlist', self.optionlists, optionlist_id)
+
+    def getOptions(self, profile_id, optionlist_id, params=None):
+        return self.list(self.options[optionlist_id], params)
+
+    def getUserGroups(self, profile_id, params=None):
+        return self.list([{'id': g} for g in self.usergroups], params)
+
+    def getUserGroup(self, profile_id, usergroup_id):
+        return self.get('usergroup', self.usergroups, usergroup_id)
+
+    def getPageGroups(self, profile_id, params=None):
+        return self.list([], params)
+
+def test_snapshot_round_trip(tmp_path):
+    snapshot = zerionPy.takeSnapshot(ProfileApi(), 100, workers=4)
+    assert snapshot['fetched'] == 4
+    assert snapshot['sections']['pages']['1']['children']['elements']['11']['data'] == {'id': 11, 'name': 'status'}
+
+    path = str(tmp_path / 'profile.json.gz')
+    zerionPy.saveSnapshot(snapshot, path)
+    loaded = zerionPy.loadSnapshot(path)
+
+    assert loaded == snapshot
+    assert zerionPy.diffSnapshots(snapshot, loaded) == {'added': [], 'removed': [], 'changed': []}
+
+def test_diff_snapshots():
+    api = ProfileApi()
+    old = zerionPy.takeSnapshot(api, 100)
+
+    api.elements[1].append({'id': 12, 'name': 'notes'})
+    api.endpoints[1][0]['url'] = 'https://example.com/other'
+    api.pages[2]['name'] = 'line_items'
+    del api.usergroups[9]
+    new = zerionPy.takeSnapshot(api, 100)
+
+    assert zerionPy.diffSnapshots(old, new) == {
+        'added': ['pages/1/elements/12'],
+        'removed': ['usergroups/9'],
+        'changed': ['pages/1/endpoints/5', 'pages/2'],
+    }
+
+def test_diff_live_fetches_only_moved_objects():
+    api = ProfileApi()
+    snapshot = zerionPy.takeSnapshot(api, 100)
+
+    api.elements[1][0]['name'] = 'state'
+    api.pages[1]['version'] = 4
+    api.gets.clear()
+
+    assert zerionPy.diffLive(api, snapshot) == {'added': [], 'removed': [], 'changed': ['pages/1', 'pages/1/elements/11']}
+    assert sorted(api.gets) == [('page', 1), ('usergroup', 9)]
+
+def test_diff_live_refetches_uncovered_children():
+    api = ProfileApi()
+    snapshot = zerionPy.takeSnapshot(api, 100)
+
+    # endpoints do not bump the page version
+    api.endpoints[1][0]['url'] = 'https://example.com/other'
+    api.gets.clear()
+
+    assert zerionPy.diffLive(api, snapshot) == {'added': [], 'removed': [], 'changed': ['pages/1/endpoints/5']}
+    assert sorted(api.gets) == [('usergroup', 9)]
+
+def test_base_from_other_profile_is_ignored():
+    api = ProfileApi()
+    snapshot = zerionPy.takeSnapshot(api, 100)
+
+    assert zerionPy.takeSnapshot(api, 200, base=snapshot)['reused'] == 0
+    assert zerionPy.takeSnapshot(api, 100, base=snapshot)['reused'] == 3
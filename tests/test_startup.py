@@ -0,0 +1,40 @@
+import subprocess
+import sys
+import json
+
+IMPORT_BUDGET = 0.05
+CONSTRUCT_BUDGET = 0.005
+
+SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import zerionPy
+imported = time.perf_counter()
+api = zerionPy.IFB('server', 'us', 'client_key', 'client_secret', 8)
+constructed = time.perf_counter()
+print(json.dumps({
+    'import': imported - start,
+    'construct': constructed - imported,
+    'modules': [m for m in ('requests', 'jwt', 'sqlite3', 'http.server', 'asyncio', 'concurrent.futures') if m in sys.modules],
+    'handlers': len(__import__('logging').getLogger().handlers),
+}))
+'''
+
+def measure():
+    result = subprocess.run([sys.executable, '-c', SCRIPT], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+def test_import_and_construct_budget():
+    runs = [measure() for _ in range(5)]
+    assert min(r['import'] for r in runs) < IMPORT_BUDGET
+    assert min(r['construct'] for r in runs) < CONSTRUCT_BUDGET
+
+def test_no_heavy_imports_or_side_effects():
+    result = measure()
+    assert result['modules'] == []
+    assert result['handlers'] == 0
+
+def test_lazy_exports():
+    import zerionPy
+    assert zerionPy.QuotaLedger.__module__ == 'zerionPy.quota'
+    assert 'syncOptions' in dir(zerionPy)
@@ -0,0 +1,81 @@
+import zerionPy
+import json
+import pytest
+from fakes import FakeResult, FakeSession, connect
+from zerionPy.streaming import iterJsonArray, decodeStream
+
+RECORDS = [{'id': i, 'text': 'a,]["' * i, 'nested': [1, {'b': None}]} for i in range(40)] + [123456, 'x', True]
+
+def split(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+@pytest.mark.parametrize('size', [1, 3, 64, 100000])
+def test_iter_json_array(size):
+    assert list(iterJsonArray(split(json.dumps(RECORDS), size))) == RECORDS
+
+def test_iter_json_array_is_incremental():
+    def chunks():
+        yield '[{"id": 1}, '
+        yield '{"id": 2}, '
+        raise AssertionError('read past the second record')
+
+    items = iterJsonArray(chunks())
+    assert next(items) == {'id': 1}
+
+@pytest.mark.parametrize('text', ['[1,]', '[1 2]', '[1', '{'])
+def test_iter_json_array_invalid(text):
+    with pytest.raises(ValueError):
+        list(iterJsonArray([text]))
+
+def test_decode_stream():
+    assert decodeStream(['  ', '{"id":', ' 1}']) == ({'id': 1}, None)
+
+    body, stream = decodeStream(split(' [1, 2, 3]', 2))
+    assert body is None and list(stream) == [1, 2, 3]
+
+def test_streamed_response():
+    result = zerionPy.ifb.ifbResponse({}, 200, stream=iter([{'id': 1}, {'id': 2}]))
+    assert [r['id'] for r in result] == [1, 2]
+
+    result = zerionPy.ifb.ifbResponse({}, 200, stream=iter([{'id': 1}, {'id': 2}]))
+    assert result.response == [{'id': 1}, {'id': 2}]
+    assert list(result) == [{'id': 1}, {'id': 2}]
+
+def test_streamed_response_consumed():
+    result = zerionPy.ifb.ifbResponse({}, 200, stream=iter([{'id': 1}]))
+    assert list(result) == [{'id': 1}]
+
+    with pytest.raises(RuntimeError):
+        result.response
+    with pytest.raises(RuntimeError):
+        list(result)
+
+def test_request_streams_list():
+    session = FakeSession([FakeResult(200, RECORDS, {'Total-Count': '43'})])
+    result = connect(session, stream_response=True).getProfiles()
+
+    assert session.streamed == [True]
+    assert result.status_code == 200 and result.headers['Total-Count'] == '43'
+    assert list(result) == RECORDS
+
+def test_request_streams_object():
+    session = FakeSession([FakeResult(200, {'id': 7})])
+    assert connect(session, stream_response=True).getProfile(7).response == {'id': 7}
+
+def test_request_streams_simple_response():
+    session = FakeSession([FakeResult(200, RECORDS)])
+    result = connect(session, stream_response=True, simple_response=True).getProfiles()
+
+    assert not isinstance(result, (list, zerionPy.ifb.ifbResponse))
+    assert list(result) == RECORDS
+
+    session = FakeSession([FakeResult(200, {'id': 7})])
+    assert connect(session, stream_response=True, simple_response=True).getProfile(7) == {'id': 7}
+
+def test_iter_pages_streams():
+    pages = [iterJsonArray(['[{"id": 1}, {"id": 2}]']), iterJsonArray(['[{"id": 3}]'])]
+
+    def getRecords(profile_id, page_id, params=None):
+        return zerionPy.ifb.ifbResponse({}, 200, stream=pages.pop(0))
+
+    assert [r['id'] for r in zerionPy.iterPages(getRecords, 1, 2, limit=2)] == [1, 2, 3]
@@ -0,0 +1,47 @@
+import zerionPy
+import re
+import pytest
+
+class KeysetApi():
+    def __init__(self, ids):
+        self.ids = set(ids)
+        self.calls = []
+
+    def getRecords(self, profile_id, page_id, params=None):
+        self.calls.append(params)
+        assert 'offset' not in params
+        match = re.match(r'id:<(\(>"(\d+)"\))?', params['fields'])
+        after = int(match.group(2)) if match.group(2) else 0
+        page = sorted(i for i in self.ids if i > after)[:params['limit']]
+        return zerionPy.ifb.ifbResponse({}, 200, [{'id': i} for i in page])
+
+def test_iter_keyset():
+    api = KeysetApi(range(1, 8))
+    records = zerionPy.iterKeyset(api.getRecords, 1, 2, params={'fields': 'status', 'offset': 50}, limit=3)
+
+    assert [r['id'] for r in records] == [1, 2, 3, 4, 5, 6, 7]
+    assert [c['fields'] for c in api.calls] == ['id:<,status', 'id:<(>"3"),status', 'id:<(>"6"),status']
+
+def test_iter_keyset_is_consistent_while_records_arrive():
+    api = KeysetApi(range(10, 100, 10))
+    seen = []
+
+    for record in zerionPy.iterKeyset(api.getRecords, 1, 2, limit=2):
+        seen.append(record['id'])
+        # new records land below and above the cursor mid-scan
+        if record['id'] < 100:
+            api.ids.update({record['id'] - 5, 1000 + record['id']})
+
+    assert seen == list(range(10, 100, 10)) + list(range(1010, 1100, 10))
+
+def test_iter_keyset_after():
+    api = KeysetApi(range(1, 6))
+    assert [r['id'] for r in zerionPy.iterKeyset(api.getRecords, 1, 2, after=3)] == [4, 5]
+
+@pytest.mark.parametrize('fields', ['id', 'id:<', 'status,id(>"5")', 'name, id'])
+def test_iter_keyset_rejects_id_fields(fields):
+    with pytest.raises(ValueError):
+        list(zerionPy.iterKeyset(KeysetApi([1]).getRecords, 1, 2, params={'fields': fields}))
+
+def test_iter_keyset_allows_other_fields():
+    assert list(zerionPy.iterKeyset(KeysetApi([1]).getRecords, 1, 2, params={'fields': 'identifier,paid'})) == [{'id': 1}]
@@ -0,0 +1,113 @@
+import zerionPy
+import json
+import socket
+import urllib.request
+import urllib.error
+import pytest
+
+def post(receiver, path, body):
+    request = urllib.request.Request(f'http://127.0.0.1:{receiver.getPort()}{path}', data=body, method='POST', headers={'Content-Type': 'application/json'})
+    try:
+        return urllib.request.urlopen(request, timeout=5).status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+def test_handle_callback():
+    receiver = zerionPy.WebhookReceiver(token='secret', maxsize=2)
+
+    assert receiver.handleCallback('/1/2?token=secret', b'{"id": 5}') == 200
+    assert receiver.handleCallback('/1/2?token=wrong', b'{"id": 6}') == 403
+    assert receiver.handleCallback('/1?token=secret', b'{"id": 6}') == 404
+    assert receiver.handleCallback('/1/2?token=secret', b'not json') == 400
+    assert receiver.handleCallback('/1/2?token=secret', b'[{"id": 7}, {"id": 8}]') == 503
+
+    assert receiver.get(timeout=1) == {'profile_id': 1, 'page_id': 2, 'record': {'id': 5}}
+    assert receiver.getStats() == {'received': 1, 'rejected': 4, 'pending': 0}
+
+    # the batch that did not fit left nothing behind for the retry to duplicate
+    assert receiver.handleCallback('/1/2?token=secret', b'[{"id": 7}, {"id": 8}]') == 200
+    assert [receiver.get(timeout=1)['record']['id'] for _ in range(2)] == [7, 8]
+
+def test_receiver_batches_to_sink():
+    batches = []
+    receiver = zerionPy.WebhookReceiver(host='127.0.0.1', port=0, sink=batches.append, batch_size=3, flush_interval=0.1)
+
+    with receiver:
+        for i in range(5):
+            assert post(receiver, '/1/2', json.dumps({'id': i}).encode()) == 200
+        assert post(receiver, '/x/2', b'{}') == 404
+
+    assert [item['record']['id'] for batch in batches for item in batch] == list(range(5))
+    assert all(len(batch) <= 3 for batch in batches)
+    assert receiver.getStats() == {'received': 5, 'rejected': 1, 'pending': 0}
+
+def exchange(receiver, request):
+    with socket.create_connection(('127.0.0.1', receiver.getPort()), timeout=5) as sock:
+        sock.sendall(request)
+        data = b''
+        while chunk := sock.recv(4096):
+            data += chunk
+        return data
+
+@pytest.mark.parametrize('length, status', [(100, b'413'), (-1, b'400')])
+def test_receiver_closes_connection_on_unread_body(length, status):
+    receiver = zerionPy.WebhookReceiver(port=0, max_body_size=10)
+
+    with receiver:
+        # the server hangs up instead of waiting for the body or parsing it as the next request
+        response = exchange(receiver, f'POST /1/2 HTTP/1.1\r\nHost: localhost\r\nContent-Length: {length}\r\n\r\n'.encode())
+        assert response.split()[1] == status
+        assert b'Connection: close' in response
+
+        assert post(receiver, '/1/2', b'{"id": 1}') == 200
+
+    assert receiver.getStats() == {'received': 1, 'rejected': 1, 'pending': 1}
+
+def test_receiver_listens_on_localhost_by_default():
+    assert zerionPy.WebhookReceiver().host == '127.0.0.1'
+
+def test_sink_error_is_logged_and_raised_from_stop(caplog):
+    batches = []
+
+    def sink(batch):
+        if not batches:
+            batches.append(None)
+            raise RuntimeError('database down')
+        batches.append(batch)
+
+    receiver = zerionPy.WebhookReceiver(port=0, sink=sink, batch_size=1, flush_interval=0.05)
+    receiver.start()
+
+    for i in range(3):
+        assert post(receiver, '/1/2', json.dumps({'id': i}).encode()) == 200
+
+    with pytest.raises(RuntimeError):
+        receiver.stop()
+
+    assert [batch[0]['record']['id'] for batch in batches[1:]] == [1, 2]
+    assert 'Webhook sink failed' in caplog.text
+
+def test_register_endpoints():
+    class EndpointsApi():
+        def __init__(self):
+            self.endpoints = {}
+
+        def postPageEndpoints(self, profile_id, page_id, body):
+            self.endpoints[page_id] = [{'id': page_id * 10, **body}, {'id': page_id * 10 + 1, 'url': 'https://other.example.com'}]
+            return zerionPy.ifb.ifbResponse({}, 201, {'id': page_id * 10})
+
+        def getPageEndpoints(self, profile_id, page_id, params=None):
+            return zerionPy.ifb.ifbResponse({}, 200, self.endpoints[page_id] if params['offset'] == 0 else [])
+
+        def deletePageEndpoints(self, profile_id, page_id, params=None):
+            self.deleted = params['fields']
+            return zerionPy.ifb.ifbResponse({}, 200, [])
+
+    api = EndpointsApi()
+    receiver = zerionPy.WebhookReceiver(token='secret')
+
+    assert zerionPy.registerEndpoints(api, 1, [2, 3], receiver, 'https://hooks.example.com/') == {2: 20, 3: 30}
+    assert api.endpoints[2][0]['url'] == 'https://hooks.example.com/1/2?token=secret'
+
+    assert zerionPy.unregisterEndpoints(api, 1, [2], 'https://hooks.example.com') == {2: [20]}
+    assert api.deleted == 'id((="20"))'
@@ -1,4 +1,57 @@
 # __init__.py
 __version__ = "1.1.3"
 
-from .ifb import IFB
\ No newline at end of file
+from .ifb import IFB
+from .retry import RetryPolicy, CircuitBreaker, CircuitOpenError
+
+# Helpers are imported on first access so `import zerionPy` stays fast
+__lazy = {
+    'QuotaLedger': 'quota',
+    'QuotaExceededError': 'quota',
+    'SharedRateLimiter': 'ratelimit',
+    'AdaptiveConcurrency': 'concurrency',
+    'WorkQueue': 'jobs',
+    'ResponseError': 'utils',
+    'iterPages': 'utils',
+    'iterResponse': 'utils',
+    'iterKeyset': 'utils',
+    'diffOptions': 'options',
+    'syncOptions': 'options',
+    'Migration': 'migrate',
+    'diffAssignments': 'assignments',
+    'reconcileAssignments': 'assignments',
+    'countRecords': 'records',
+    'bulkDeleteRecords': 'records',
+    'bulkUpdateRecords': 'records',
+    'WebhookReceiver': 'webhook',
+    'registerEndpoints': 'webhook',
+    'unregisterEndpoints': 'webhook',
+    'FeedFollower': 'feed',
+    'buildSchema': 'flatten',
+    'RecordFlattener': 'flatten',
+    'flattenRecords': 'flatten',
+    'RecordSnapshot': 'changes',
+    'diffRecords': 'changes',
+    'pushChanges': 'changes',
+    'exportLocalizations': 'localization',
+    'importLocalizations': 'localization',
+    'WriteJournal': 'journal',
+    'BulkWriter': 'journal',
+    'takeSnapshot': 'snapshot',
+    'saveSnapshot': 'snapshot',
+    'loadSnapshot': 'snapshot',
+    'diffSnapshots': 'snapshot',
+    'diffLive': 'snapshot',
+}
+
+def __getattr__(name):
+    if name in __lazy:
+        import importlib
+        value = getattr(importlib.import_module(f'.{__lazy[name]}', __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(__lazy))
@@ -0,0 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import MAX_LIMIT, FILTER_CHUNK_SIZE, checkResponse, chunks, buildFilter, iterPages
+
+PERMISSION_FIELDS = ('can_collect', 'can_view', 'can_edit', 'can_delete')
+
+# section: (get, post, put, delete, key field, permission fields)
+ASSIGNMENTS = {
+    'page_users': ('getPageUserAssignments', 'postPageUserAssignments', 'putPageUserAssignments', 'deletePageUserAssignments', 'user_id', PERMISSION_FIELDS),
+    'group_pages': ('getUserGroupPageAssignments', 'postUserGroupPageAssignments', 'putUserGroupPageAssignments', 'deleteUserGroupPageAssignments', 'page_id', PERMISSION_FIELDS),
+    'group_users': ('getUserGroupUserAssignments', 'postUserGroupUserAssignments', None, 'deleteUserGroupUserAssignments', 'user_id', ()),
+}
+
+def diffAssignments(current:dict, desired:dict, fields=PERMISSION_FIELDS):
+    """Compare assignments keyed by user or page id
+    Returns (inserts, updates, deletes); updates are grouped by their new permissions so each group is one filtered PUT
+    """
+    inserts, updates = [], {}
+
+    for key, permissions in desired.items():
+        permissions = {f: v for f, v in (permissions or {}).items() if f in fields}
+
+        if key not in current:
+            inserts.append((key, permissions))
+        elif any(current[key].get(f) != v for f, v in permissions.items()):
+            updates.setdefault(tuple(sorted(permissions.items())), []).append(key)
+
+    deletes = [key for key in current if key not in desired]
+
+    return inserts, [(dict(permissions), keys) for permissions, keys in updates.items()], deletes
+
+def _normalize(assignments):
+    if isinstance(assignments, dict):
+        return assignments
+    return {key: {} for key in assignments}
+
+def _reconcile(api, profile_id, section, object_id, desired, dry_run, chunk_size):
+    get, post, put, delete, key_field, fields = ASSIGNMENTS[section]
+
+    params = {'fields': ','.join((key_field,) + fields)}
+    current = {a[key_field]: a for a in iterPages(getattr(api, get), profile_id, object_id, params=params)}
+    inserts, updates, deletes = diffAssignments(current, desired, fields)
+
+    if not dry_run:
+        for chunk in chunks(inserts, chunk_size):
+            checkResponse(getattr(api, post)(profile_id, object_id, [{key_field: key, **permissions} for key, permissions in chunk]))
+
+        for permissions, keys in updates:
+            for chunk in chunks(keys, FILTER_CHUNK_SIZE):
+                params = {'fields': buildFilter(key_field, chunk), 'limit': len(chunk)}
+                checkResponse(getattr(api, put)(profile_id, object_id, permissions, params))
+
+        for chunk in chunks(deletes, FILTER_CHUNK_SIZE):
+            params = {'fields': buildFilter(key_field, chunk), 'limit': len(chunk)}
+            checkResponse(getattr(api, delete)(profile_id, object_id, params))
+
+    return {
+        'inserted': [key for key, _ in inserts],
+        'updated': [key for _, keys in updates for key in keys],
+        'deleted': deletes,
+    }
+
+def reconcileAssignments(api, profile_id, desired:dict, workers:int=8, dry_run:bool=False, chunk_size:int=MAX_LIMIT):
+    """Make page and user group assignments match a desired permissions matrix
+    desired maps a section to {object id: assignments}:
+        'page_users':  {page_id: {user_id: {'can_collect': True, ...}}}
+        'group_pages': {usergroup_id: {page_id: {'can_view': True, ...}}}
+        'group_users': {usergroup_id: [user_id, ...]}
+    Only the pages and user groups listed are touched; each is read, diffed and written concurrently
+    Returns a report keyed by (section, object id)
+    """
+    unknown = set(desired) - set(ASSIGNMENTS)
+    if unknown:
+        raise ValueError(f"Unknown assignment sections: {unknown}")
+
+    jobs = [(section, object_id, _normalize(assignments)) for section, objects in desired.items() for object_id, assignments in objects.items()]
+
+    with ThreadPoolExecutor(workers) as pool:
+        futures = {(section, object_id): pool.submit(_reconcile, api, profile_id, section, object_id, assignments, dry_run, chunk_size) for section, object_id, assignments in jobs}
+        return {key: future.result() for key, future in futures.items()}
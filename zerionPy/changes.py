@@ -0,0 +1,108 @@
+import json
+import os
+
+from .utils import FILTER_CHUNK_SIZE, checkResponse, chunks, buildFilter, joinFields
+
+class RecordSnapshot():
+    """Last-known remote state of records, kept in a local JSON file keyed by record id"""
+    def __init__(self, path:str):
+        self.path = path
+        self.__records = {}
+
+        if os.path.exists(path):
+            with open(path) as f:
+                self.__records = {int(k): v for k, v in json.load(f).items()}
+
+    def __contains__(self, record_id):
+        return record_id in self.__records
+
+    def __len__(self):
+        return len(self.__records)
+
+    def get(self, record_id):
+        return self.__records.get(record_id)
+
+    def update(self, records):
+        """Merge (partial) records into the snapshot"""
+        for record in records:
+            self.__records.setdefault(record['id'], {}).update(record)
+
+    def save(self):
+        temp = f'{self.path}.tmp'
+        with open(temp, 'w') as f:
+            json.dump(self.__records, f, separators=(',', ':'))
+        os.replace(temp, self.path)
+
+def diffRecord(desired:dict, remote:dict):
+    """Return the fields of desired whose values differ from remote"""
+    return {k: v for k, v in desired.items() if k != 'id' and (k not in remote or remote[k] != v)}
+
+def diffRecords(desired, remote:dict):
+    """Compare desired records against remote records keyed by id
+    Returns (changes, unchanged, missing): changes hold the id and changed fields only,
+    unchanged and missing are lists of ids
+    """
+    changes, unchanged, missing = [], [], []
+
+    for record in desired:
+        current = remote.get(record['id'])
+        if current is None:
+            missing.append(record['id'])
+            continue
+
+        changed = diffRecord(record, current)
+        if changed:
+            changes.append({'id': record['id'], **changed})
+        else:
+            unchanged.append(record['id'])
+
+    return changes, unchanged, missing
+
+def fetchRecords(api, profile_id, page_id, ids, fields):
+    """Fetch records by id with only the given fields, FILTER_CHUNK_SIZE ids per call"""
+    remote = {}
+    for chunk in chunks(ids, FILTER_CHUNK_SIZE):
+        params = {'fields': joinFields(buildFilter('id', chunk), *sorted(set(fields) - {'id'})), 'limit': len(chunk)}
+        for record in checkResponse(api.getRecords(profile_id, page_id, params)):
+            remote[record['id']] = record
+    return remote
+
+def pushChanges(api, profile_id, page_id, desired, snapshot:RecordSnapshot=None, dry_run:bool=False):
+    """Send only the changed fields of desired records with batched putRecords
+    Remote state comes from snapshot when it has the record, otherwise from a getRecords fetch
+    projected to the desired fields. Unchanged records are not sent at all. The snapshot is
+    updated with what was written
+    """
+    desired = list(desired)
+    if any('id' not in record for record in desired):
+        raise ValueError("Desired records require an id")
+
+    remote = {}
+    unknown = []
+    for record in desired:
+        if snapshot is not None and record['id'] in snapshot:
+            remote[record['id']] = snapshot.get(record['id'])
+        else:
+            unknown.append(record['id'])
+
+    if unknown:
+        fields = {k for record in desired for k in record}
+        fetched = fetchRecords(api, profile_id, page_id, unknown, fields)
+        remote.update(fetched)
+        if snapshot is not None:
+            snapshot.update(fetched.values())
+
+    changes, unchanged, missing = diffRecords(desired, remote)
+
+    if not dry_run:
+        for chunk in chunks(changes, FILTER_CHUNK_SIZE):
+            params = {'fields': buildFilter('id', [record['id'] for record in chunk]), 'limit': len(chunk)}
+            checkResponse(api.putRecords(profile_id, page_id, chunk, params))
+
+            if snapshot is not None:
+                snapshot.update(chunk)
+
+        if snapshot is not None:
+            snapshot.save()
+
+    return {'updated': changes, 'unchanged': unchanged, 'missing': missing}
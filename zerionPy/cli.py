@@ -0,0 +1,276 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+
+from .ifb import IFB
+from .retry import RetryPolicy
+from .utils import MAX_LIMIT, ResponseError, iterKeyset, iterResponse, joinFields
+
+class Progress():
+    """Thread-safe counter that redraws one status line on stderr at most every interval seconds"""
+    def __init__(self, label:str, total:int=None, quiet:bool=False, interval:float=1.0, stream=None):
+        self.label = label
+        self.total = total
+        self.quiet = quiet
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.done = 0
+
+        self.__started = time.monotonic()
+        self.__drawn = 0
+        self.__lock = threading.Lock()
+
+    def __line(self):
+        elapsed = time.monotonic() - self.__started
+        done = f'{self.done}/{self.total}' if self.total is not None else str(self.done)
+        return f'{self.label}: {done} ({self.done / elapsed if elapsed else 0:.0f}/s, {elapsed:.1f}s)'
+
+    def update(self, count:int=1):
+        with self.__lock:
+            self.done += count
+            now = time.monotonic()
+            if not self.quiet and now - self.__drawn >= self.interval:
+                self.__drawn = now
+                self.stream.write('\r' + self.__line())
+                self.stream.flush()
+
+    def finish(self):
+        if not self.quiet:
+            self.stream.write('\r' + self.__line() + '\n')
+            self.stream.flush()
+
+def _connect(args):
+    rate_limiter = None
+    if args.rate:
+        from .ratelimit import SharedRateLimiter
+        rate_limiter = SharedRateLimiter(args.rate_file, rate=args.rate)
+
+    return IFB(args.server, args.region, args.client_key, args.client_secret, args.api_version, retry_policy=RetryPolicy(), rate_limiter=rate_limiter, stream_response=True)
+
+def _readRecords(path):
+    """Read a JSON array or JSON lines file"""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+
+    if text.lstrip().startswith('['):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+def _readOptions(path):
+    if not path.endswith('.csv'):
+        return _readRecords(path)
+
+    # CSV cells are text; numeric columns such as sort_order and score must compare equal to the API's numbers
+    with open(path, encoding='utf-8', newline='') as f:
+        return [{k: int(v) if k not in ('key_value', 'label') and v.lstrip('-').isdigit() else v for k, v in row.items()} for row in csv.DictReader(f)]
+
+def _rfindNewline(f, end, block_size):
+    """Return the position of the last newline before end in a binary file, or -1"""
+    while end > 0:
+        start = max(0, end - block_size)
+        f.seek(start)
+        index = f.read(end - start).rfind(b'\n')
+        if index != -1:
+            return start + index
+        end = start
+    return -1
+
+def _resumePoint(path, block_size:int=1 << 20):
+    """Return the number of complete lines of a previous export and the id of the last one, dropping a torn last line
+    The file is scanned in blocks, so resuming a large export does not load it into memory
+    """
+    if not os.path.exists(path):
+        return 0, None
+
+    with open(path, 'rb+') as f:
+        last = _rfindNewline(f, f.seek(0, os.SEEK_END), block_size)
+        f.truncate(last + 1)
+        if last == -1:
+            return 0, None
+
+        f.seek(0)
+        count = sum(block.count(b'\n') for block in iter(lambda: f.read(block_size), b''))
+
+        first = _rfindNewline(f, last, block_size) + 1
+        f.seek(first)
+        return count, json.loads(f.read(last - first))['id']
+
+##############################
+# Commands
+##############################
+def export(api, args):
+    from .records import countRecords
+
+    if args.resume and args.output == '-':
+        raise ValueError("--resume requires --output")
+
+    offset, last_id = _resumePoint(args.output) if args.resume else (0, None)
+    total = countRecords(api, args.profile_id, args.page_id, args.fields)
+    fields = joinFields('id:<', args.fields)
+    progress = Progress('export', total, args.quiet)
+    progress.update(offset)
+
+    def fetch(offset):
+        return list(iterResponse(api.getRecords(args.profile_id, args.page_id, {'fields': fields, 'limit': MAX_LIMIT, 'offset': offset})))
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'a' if args.resume else 'w', encoding='utf-8')
+    try:
+        if args.keyset:
+            records = iterKeyset(api.getRecords, args.profile_id, args.page_id, params={'fields': args.fields}, after=last_id)
+            for page in iter(lambda: list(islice(records, MAX_LIMIT)), []):
+                _writeRecords(out, page, progress)
+        else:
+            # pages are fetched concurrently but written in order, with a bounded number in flight
+            with ThreadPoolExecutor(args.workers) as pool:
+                pending = deque()
+                for page_offset in range(offset, total, MAX_LIMIT):
+                    pending.append(pool.submit(fetch, page_offset))
+                    if len(pending) >= 2 * args.workers:
+                        _writeRecords(out, pending.popleft().result(), progress)
+
+                while pending:
+                    _writeRecords(out, pending.popleft().result(), progress)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    progress.finish()
+
+def _writeRecords(out, records, progress):
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+    out.flush()
+    progress.update(len(records))
+
+def import_(api, args):
+    from .journal import WriteJournal, BulkWriter
+
+    journal_path = args.journal or f'{args.input}.journal'
+    if os.path.exists(journal_path) and not args.resume:
+        raise ValueError(f"{journal_path} exists; pass --resume to continue the previous import")
+
+    records = _readRecords(args.input)
+    progress = Progress('import', len(records), args.quiet)
+
+    with WriteJournal(journal_path) as journal:
+        writer = BulkWriter(api, args.profile_id, args.page_id, journal, chunk_size=args.chunk_size, key_field=args.key_field, workers=args.workers, progress=progress.update)
+        report = writer.putRecords(records) if args.update else writer.postRecords(records)
+
+    progress.finish()
+    print(json.dumps({k: v for k, v in report.items() if k != 'ids'}))
+    return 2 if report['in_doubt'] else 0
+
+def optionsSync(api, args):
+    from .options import syncOptions
+
+    lists = []
+    for pair in args.lists:
+        optionlist_id, _, path = pair.partition('=')
+        if not path:
+            raise ValueError(f"Expected OPTIONLIST_ID=FILE, got {pair}")
+        lists.append((int(optionlist_id), path))
+
+    progress = Progress('options-sync', len(lists), args.quiet)
+
+    def sync(item):
+        report = syncOptions(api, args.profile_id, item[0], _readOptions(item[1]), delete_missing=not args.keep_missing, dry_run=args.dry_run)
+        progress.update()
+        return item[0], {k: v if isinstance(v, int) else len(v) for k, v in report.items()}
+
+    with ThreadPoolExecutor(args.workers) as pool:
+        reports = dict(pool.map(sync, lists))
+
+    progress.finish()
+    print(json.dumps(reports))
+
+def purge(api, args):
+    from .records import bulkDeleteRecords
+
+    dry_run = not args.yes
+    progress = Progress('purge', len(args.page_ids), args.quiet)
+
+    def delete(page_id):
+        report = bulkDeleteRecords(api, args.profile_id, page_id, args.filter, chunk_size=args.chunk_size, dry_run=dry_run)
+        progress.update()
+        return page_id, report
+
+    with ThreadPoolExecutor(args.workers) as pool:
+        reports = dict(pool.map(delete, args.page_ids))
+
+    progress.finish()
+    print(json.dumps(reports))
+    if dry_run:
+        print('dry run, pass --yes to delete', file=sys.stderr)
+
+def buildParser():
+    parser = argparse.ArgumentParser(prog='zerionpy', description='Bulk iFormBuilder operations')
+    parser.add_argument('--server', default=os.environ.get('ZERION_SERVER'))
+    parser.add_argument('--region', default=os.environ.get('ZERION_REGION', 'us'))
+    parser.add_argument('--client-key', default=os.environ.get('ZERION_CLIENT_KEY'))
+    parser.add_argument('--client-secret', default=os.environ.get('ZERION_CLIENT_SECRET'))
+    parser.add_argument('--api-version', type=float, default=float(os.environ.get('ZERION_VERSION', 8)))
+    parser.add_argument('--workers', type=int, default=8, help='concurrent requests')
+    parser.add_argument('--rate', type=float, help='requests per second shared by every zerionpy process on this host')
+    parser.add_argument('--rate-file', default='zerionpy_ratelimit.db')
+    parser.add_argument('--quiet', action='store_true', help='no progress output')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('export', help='write the records of a page as JSON lines')
+    command.add_argument('profile_id', type=int)
+    command.add_argument('page_id', type=int)
+    command.add_argument('--fields', help='fields grammar columns and filters')
+    command.add_argument('--output', '-o', default='-')
+    command.add_argument('--keyset', action='store_true', help='walk the page by id instead of fetching offsets concurrently; consistent while records are added')
+    command.add_argument('--resume', action='store_true', help='append to an interrupted export')
+    command.set_defaults(run=export)
+
+    command = commands.add_parser('import', help='post or put records from a JSON or JSON lines file')
+    command.add_argument('profile_id', type=int)
+    command.add_argument('page_id', type=int)
+    command.add_argument('input')
+    command.add_argument('--update', action='store_true', help='put records by id instead of posting them')
+    command.add_argument('--key-field', help='unique field used to re-check interrupted posts')
+    command.add_argument('--chunk-size', type=int, default=MAX_LIMIT)
+    command.add_argument('--journal', help='journal path, defaults to INPUT.journal')
+    command.add_argument('--resume', action='store_true', help='continue from an existing journal')
+    command.set_defaults(run=import_)
+
+    command = commands.add_parser('options-sync', help='make option lists match JSON, JSON lines or CSV files')
+    command.add_argument('profile_id', type=int)
+    command.add_argument('lists', nargs='+', metavar='OPTIONLIST_ID=FILE')
+    command.add_argument('--keep-missing', action='store_true', help='keep options that are not in the file')
+    command.add_argument('--dry-run', action='store_true')
+    command.set_defaults(run=optionsSync)
+
+    command = commands.add_parser('purge', help='delete the records of pages matching a filter')
+    command.add_argument('profile_id', type=int)
+    command.add_argument('page_ids', type=int, nargs='+')
+    command.add_argument('--filter', required=True, help='fields grammar filter, e.g. created_date(<"2020-01-01")')
+    command.add_argument('--chunk-size', type=int, default=MAX_LIMIT)
+    command.add_argument('--yes', action='store_true', help='delete; without it only the matching counts are shown')
+    command.set_defaults(run=purge)
+
+    return parser
+
+def main(argv=None):
+    args = buildParser().parse_args(argv)
+
+    if args.workers < 1:
+        print('zerionpy: --workers must be at least 1', file=sys.stderr)
+        return 1
+
+    try:
+        return args.run(_connect(args), args) or 0
+    except (ResponseError, ValueError, OSError) as e:
+        print(f'zerionpy: {e}', file=sys.stderr)
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import threading
+import time
+
+class AdaptiveConcurrency():
+    """AIMD limit on in-flight requests
+    After a full window of successful requests the limit grows by increase; a 429, a 5xx, a connection
+    error or a latency above latency_target cuts it by the decrease factor. Only requests sent after
+    the last cut can cut it again, so a burst of failures from the same congestion only counts once
+    """
+    def __init__(self, initial:int=4, minimum:int=1, maximum:int=64, increase:int=1, decrease:float=0.5, latency_target:float=None):
+        if not 1 <= minimum <= initial <= maximum or increase < 1 or not 0 < decrease < 1:
+            raise ValueError("Invalid concurrency values")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+
+        self.__limit = initial
+        self.__in_flight = 0
+        self.__successes = 0
+        self.__decreased_at = float('-inf')
+        self.__latency = None
+        self.__decreases = 0
+        self.__condition = threading.Condition()
+        self.__local = threading.local()
+
+    def __enter__(self):
+        self.acquire()
+        self.__local.started = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release(time.monotonic() - self.__local.started, error=exc_type is not None)
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        with self.__condition:
+            while self.__in_flight >= self.__limit:
+                self.__condition.wait()
+            self.__in_flight += 1
+
+    def release(self, latency:float=None, status_code:int=None, error:bool=False):
+        """Report how a request went and free its slot"""
+        with self.__condition:
+            self.__in_flight -= 1
+            now = time.monotonic()
+
+            if latency is not None:
+                self.__latency = latency if self.__latency is None else 0.8 * self.__latency + 0.2 * latency
+
+            slow = self.latency_target is not None and self.__latency is not None and self.__latency > self.latency_target
+            congested = error or status_code == 429 or (status_code is not None and status_code >= 500)
+
+            if congested or slow:
+                self.__successes = 0
+                started = now - latency if latency is not None else now
+                if started >= self.__decreased_at:
+                    self.__limit = max(self.minimum, int(self.__limit * self.decrease))
+                    self.__decreased_at = now
+                    self.__decreases += 1
+            else:
+                self.__successes += 1
+                if self.__successes >= self.__limit:
+                    self.__limit = min(self.maximum, self.__limit + self.increase)
+                    self.__successes = 0
+
+            self.__condition.notify_all()
+
+    def getLimit(self):
+        return self.__limit
+
+    def getStats(self):
+        with self.__condition:
+            return {
+                'limit': self.__limit,
+                'in_flight': self.__in_flight,
+                'latency': round(self.__latency, 4) if self.__latency is not None else None,
+                'decreases': self.__decreases,
+            }
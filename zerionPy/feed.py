@@ -0,0 +1,113 @@
+import asyncio
+import json
+import os
+import threading
+
+from .utils import checkResponse
+
+class FeedFollower():
+    """Follow a page feed, yielding only entries newer than the stored cursor
+    The polling interval drops to min_interval while entries keep arriving and grows by backoff up to
+    max_interval while the feed is idle. With cursor_path the cursor survives restarts; follow() only
+    saves an entry's id once the consumer asks for the next one, so a crash mid-batch re-delivers
+    the unfinished entries instead of losing them
+    """
+    def __init__(self, api, profile_id, page_id, params:dict=None, cursor_path:str=None, cursor_param:str='since_id', min_interval:float=1, max_interval:float=60, backoff:float=2):
+        if not 0 < min_interval <= max_interval or backoff < 1:
+            raise ValueError("Invalid polling intervals")
+
+        self.api = api
+        self.profile_id = profile_id
+        self.page_id = page_id
+        self.params = dict(params or {})
+        self.cursor_path = cursor_path
+        self.cursor_param = cursor_param
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+        self.__interval = min_interval
+        self.__stopped = threading.Event()
+        self.__cursor = None
+
+        if cursor_path is not None and os.path.exists(cursor_path):
+            with open(cursor_path) as f:
+                self.__cursor = json.load(f).get('cursor')
+
+        # last fetched id, ahead of the cursor while fetched entries are still being handled
+        self.__position = self.__cursor
+
+    def getCursor(self):
+        return self.__cursor
+
+    def getInterval(self):
+        return self.__interval
+
+    def setCursor(self, cursor):
+        """Record cursor as handled, saving it to cursor_path"""
+        self.__cursor = cursor
+        if self.__position is None or cursor > self.__position:
+            self.__position = cursor
+
+        if self.cursor_path is not None:
+            temp = f'{self.cursor_path}.tmp'
+            with open(temp, 'w') as f:
+                json.dump({'cursor': cursor}, f)
+            os.replace(temp, self.cursor_path)
+
+    def poll(self):
+        """Make one feed call and return the entries past the last one fetched, in id order
+        The cursor is not saved; call setCursor() once the entries are handled
+        """
+        params = dict(self.params)
+        if self.__position is not None:
+            params[self.cursor_param] = self.__position
+
+        entries = checkResponse(self.api.getPageFeed(self.profile_id, self.page_id, params)) or []
+        if self.__position is not None:
+            entries = [e for e in entries if e['id'] > self.__position]
+
+        if entries:
+            entries.sort(key=lambda e: e['id'])
+            self.__position = entries[-1]['id']
+            self.__interval = self.min_interval
+        else:
+            self.__interval = min(self.max_interval, self.__interval * self.backoff)
+
+        return entries
+
+    def stop(self):
+        """Stop following once the consumer is done with the current entry"""
+        self.__stopped.set()
+
+    def __rewind(self):
+        # entries fetched but not handed out are fetched again by the next poll
+        self.__position = self.__cursor
+
+    def follow(self):
+        """Yield new feed entries until stop() is called"""
+        self.__stopped.clear()
+
+        while not self.__stopped.is_set():
+            for entry in self.poll():
+                yield entry
+                self.setCursor(entry['id'])
+                if self.__stopped.is_set():
+                    self.__rewind()
+                    return
+
+            self.__stopped.wait(self.__interval)
+
+    async def afollow(self):
+        """Asynchronous follow(); feed calls run in a worker thread so the event loop is never blocked"""
+        self.__stopped.clear()
+
+        while not self.__stopped.is_set():
+            for entry in await asyncio.to_thread(self.poll):
+                yield entry
+                self.setCursor(entry['id'])
+                if self.__stopped.is_set():
+                    self.__rewind()
+                    return
+
+            await asyncio.to_thread(self.__stopped.wait, self.__interval)
@@ -0,0 +1,85 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .utils import SUBFORM_DATA_TYPE, checkResponse, iterPages
+
+MULTI_SELECT_DATA_TYPE = 9
+
+def buildSchema(api, profile_id, page_id):
+    """Describe a page and its subform pages from getElements for RecordFlattener"""
+    page = checkResponse(api.getPage(profile_id, page_id))
+    elements = list(iterPages(api.getElements, profile_id, page_id, params={'fields': 'name,data_type,data_size'}))
+
+    return {
+        'page_id': page_id,
+        'name': page['name'],
+        'multi_select': [e['name'] for e in elements if e['data_type'] == MULTI_SELECT_DATA_TYPE],
+        'subforms': {e['name']: buildSchema(api, profile_id, e['data_size']) for e in elements if e['data_type'] == SUBFORM_DATA_TYPE},
+    }
+
+class RecordFlattener():
+    """Turn nested records into rows for relational tables
+    Each page becomes a table named after the page; subform records become rows of the subform page's
+    table with parent_id set to the owning record, multi-select values become rows of <table>_<element>
+    and object values such as locations are spread over <element>_<key> columns
+    """
+    def __init__(self, schema:dict):
+        self.schema = schema
+
+    def __flatten(self, schema, record, parent_id, tables):
+        row = {'parent_id': parent_id} if parent_id is not None else {}
+        record_id = record.get('id')
+
+        for name, value in record.items():
+            if name in schema['subforms']:
+                for child in value or []:
+                    self.__flatten(schema['subforms'][name], child, record_id, tables)
+                continue
+
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    row[f'{name}_{key}'] = item
+                continue
+
+            row[name] = value
+
+            if name in schema['multi_select'] and value:
+                values = value if isinstance(value, list) else str(value).split(',')
+                tables.setdefault(f'{schema["name"]}_{name}', []).extend({'record_id': record_id, 'value': v} for v in values)
+
+        tables.setdefault(schema['name'], []).append(row)
+
+    def flatten(self, records):
+        """Flatten records into {table name: rows}"""
+        tables = {}
+        for record in records:
+            self.__flatten(self.schema, record, None, tables)
+        return tables
+
+def _flattenChunk(schema, records):
+    return RecordFlattener(schema).flatten(records)
+
+def flattenRecords(schema:dict, records, batch_size:int=500, workers:int=None):
+    """Flatten a stream of records, yielding {table name: rows} per batch of batch_size records
+    With workers, batches are flattened in a process pool; at most twice as many batches as
+    workers are in flight so memory stays bounded, and batches are yielded in input order
+    """
+    records = iter(records)
+    batches = iter(lambda: list(islice(records, batch_size)), [])
+
+    if not workers or workers < 2:
+        flattener = RecordFlattener(schema)
+        for batch in batches:
+            yield flattener.flatten(batch)
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(_flattenChunk, schema, batch))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
@@ -1,20 +1,48 @@
 import re
-import inspect
+import sys
 import time
-import re
-import jwt
-import requests
 import json
-from pprint import pprint
-
+import threading
 import logging
-logging.basicConfig(filename='app.log', level=logging.DEBUG, format='%(asctime)s - %(message)s', datefmt='%d-%b-%y %H:%M:%S')
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from .retry import RetryPolicy, CircuitBreaker, CircuitOpenError
+
+if TYPE_CHECKING:
+    from .quota import QuotaLedger
+    from .ratelimit import SharedRateLimiter
+    from .concurrency import AdaptiveConcurrency
+
+# jwt and requests are imported on first use to keep import and construction fast
+logger = logging.getLogger(__name__)
+
+# seconds before a failed access token request is attempted again
+TOKEN_RETRY_INTERVAL = 30
 
 class ifbResponse():
-    def __init__(self, headers, status_code, response):
+    def __init__(self, headers, status_code, response=None, stream=None):
         self.headers = headers
         self.status_code = status_code
-        self.response = response
+        self.__response = response
+        self.__stream = stream
+        self.__consumed = False
+
+    @property
+    def response(self):
+        """Response body; a streamed list is read in full the first time this is accessed"""
+        if self.__consumed:
+            raise RuntimeError("Streamed response was already iterated; read response before iterating to keep the items")
+        if self.__stream is not None:
+            self.__response = list(self.__stream)
+            self.__stream = None
+        return self.__response
+
+    @response.setter
+    def response(self, value):
+        self.__response = value
+        self.__stream = None
+        self.__consumed = False
 
     def __str__(self):
         return str(self.status_code)
@@ -23,11 +51,17 @@ class ifbResponse():
         return str(self.status_code)
 
     def __iter__(self):
-        for item in self.response:
-            yield item
+        if self.__stream is not None:
+            # streamed items are handed out as they are parsed and not kept
+            stream, self.__stream = self.__stream, None
+            self.__consumed = True
+            yield from stream
+        else:
+            for item in self.response:
+                yield item
 
 class IFB():
-    def __init__(self, server:str, region:str, client_key:str, client_secret:str, version:float, simple_response:bool=False, skip_rate_limit_retry:bool=False):
+    def __init__(self, server:str, region:str, client_key:str, client_secret:str, version:float, simple_response:bool=False, skip_rate_limit_retry:bool=False, retry_policy:RetryPolicy=None, circuit_breaker:CircuitBreaker=None, quota:'QuotaLedger'=None, quota_job:str=None, quota_priority:str='normal', stream_response:bool=False, rate_limiter:'SharedRateLimiter'=None, concurrency:'AdaptiveConcurrency'=None):
         if not all((server, client_key, client_secret, version, region)):
             raise ValueError("Invalid parameter values")
 
@@ -37,6 +71,9 @@ class IFB():
         if region not in ('us', 'uk', 'au', 'hipaa', 'qa', 'sandbox'):
             raise ValueError("Invalid region")
 
+        if quota_priority not in ('high', 'normal', 'low'):
+            raise ValueError("Invalid quota priority")
+
         self.__server = server
         self.__client_key = client_key
         self.__client_secret = client_secret
@@ -45,14 +82,23 @@ class IFB():
         self.__isSimpleResponse = simple_response
         self.__isSkipRateLimitRetry = skip_rate_limit_retry
         self.__isZIM = "." in client_key
+        self.__isStreamResponse = stream_response
+        self.__retry_policy = retry_policy
+        self.__circuit_breaker = circuit_breaker
+        self.__quota = quota
+        self.__quota_job = quota_job
+        self.__quota_priority = quota_priority
+        self.__rate_limiter = rate_limiter
+        self.__concurrency = concurrency
 
         self.__api_calls = 0
+        self.__lock = threading.Lock()
         self.__access_token = None
         self.__access_token_expiration = None
+        self.__token_retry_at = 0
         self.__start_time = time.time()
 
-        self.__session = requests.Session()
-        self.__session.headers.update({ 'Content-Type': 'application/json' })
+        self.__session = None
 
         try:
             match self.__version >= 8:
@@ -62,19 +108,32 @@ class IFB():
                 case False:
                     self.__host = f'https://{self.__server}.iformbuilder.com/exzact/api/v60'
                     self.__token_url = f'https://{self.__server}.iformbuilder.com/exzact/api/oauth/token'
+
+            self.__breaker_host = urlsplit(self.__host).netloc
             
             if self.__isZIM:
                 self.__token_url = "https://qa-identity.zerionsoftware.com/oauth2/token" if self.__region in ("qa", "sandbox") else "https://identity.zerionsoftware.com/oauth2/token"
-
-            self.__requestAccessToken()
         except Exception as e:
             print(e)
 
+    def __getSession(self):
+        if self.__session is None:
+            import requests
+
+            session = requests.Session()
+            session.headers.update({ 'Content-Type': 'application/json' })
+            self.__session = session
+
+        return self.__session
+
     def __requestAccessToken(self):
         """Create JWT and request iFormBuilder Access Token
         If Token is successfully returned, store in session header
         Else null token is stored in session header
         """
+        import jwt
+        import requests
+
         try:
             jwt_payload = {
                 'iss': self.__client_key,
@@ -93,15 +152,30 @@ class IFB():
             token_request.raise_for_status()
         except Exception as e:
             print(e)
+            self.__token_retry_at = time.monotonic() + TOKEN_RETRY_INTERVAL
         else:
             if not token_request.json().get('access_token'):
                 raise ValueError("Access token not granted")
 
-            self.__access_token = token_request.json().get('access_token')
-            self.__session.headers.update({ 'Authorization': f'Bearer {self.__access_token}'})
+            access_token = token_request.json().get('access_token')
+            self.__getSession().headers.update({ 'Authorization': f'Bearer {access_token}'})
+            # the expiration is set before the token is published, so a caller that sees the token never compares against None
             self.__access_token_expiration = time.time() + 3300
+            self.__access_token = access_token
+
+    def __needsAccessToken(self):
+        if self.__access_token is not None and time.time() <= self.__access_token_expiration:
+            return False
+        return time.monotonic() >= self.__token_retry_at
+
+    def __ensureAccessToken(self):
+        if self.__needsAccessToken():
+            with self.__lock:
+                if self.__needsAccessToken():
+                    self.__requestAccessToken()
 
     def getAccessToken(self):
+        self.__ensureAccessToken()
         return self.__access_token
 
     def getApiCount(self):
@@ -116,6 +190,19 @@ class IFB():
     def getAccessTokenExpiration(self):
         return self.__access_token_expiration
 
+    def getQuotaRemaining(self):
+        if self.__quota is None:
+            return None
+        return self.__quota.getRemaining(self.__server, self.__quota_job)
+
+    def getStats(self):
+        return {
+            'api_calls': self.__api_calls,
+            'api_lifetime': self.getApiLifetime(),
+            'quota_remaining': self.getQuotaRemaining(),
+            'concurrency': self.__concurrency.getStats() if self.__concurrency is not None else None,
+        }
+
     def getLastExecutionTime(self):
         return self.__last_execution_time
 
@@ -132,24 +219,115 @@ class IFB():
             case False:
                 url = f'{self.__host}/{self.__resources[resource]}'
 
-        if self.__access_token is not None and time.time() > self.__access_token_expiration:
-            self.__requestAccessToken()
+        import requests
 
-        while True:
-            result = self.__session.request(method, url, data=json.dumps(body), params=params)
+        self.__ensureAccessToken()
+        session = self.__getSession()
+        attempt = 0
 
-            self.__api_calls += 1
-            self.__last_execution_time = result.elapsed
+        while True:
+            # checked first so an open circuit fails fast without spending quota or rate limit permits
+            if self.__circuit_breaker is not None and not self.__circuit_breaker.allowRequest(self.__breaker_host):
+                raise CircuitOpenError(self.__breaker_host, self.__circuit_breaker.getRetryAfter(self.__breaker_host))
+
+            recorded = False
+
+            try:
+                # a refusal here gives the half-open probe back in the finally below
+                if self.__quota is not None:
+                    self.__quota.acquire(self.__server, self.__quota_job, self.__quota_priority)
+
+                if self.__rate_limiter is not None:
+                    self.__rate_limiter.acquire(self.__host)
+
+                if self.__concurrency is not None:
+                    self.__concurrency.acquire()
+
+                started = time.monotonic()
+
+                try:
+                    result = session.request(method, url, data=json.dumps(body), params=params, stream=self.__isStreamResponse)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    self.__releaseSlot(started, error=True)
+
+                    if self.__circuit_breaker is not None:
+                        self.__circuit_breaker.recordFailure(self.__breaker_host)
+                    recorded = True
+
+                    sent = not isinstance(e, requests.exceptions.ConnectTimeout)
+                    if self.__retry_policy is None or not self.__retry_policy.shouldRetry(method, attempt, error=e, sent=sent):
+                        raise
+
+                    delay = self.__retry_policy.getBackoff(attempt)
+                    logger.debug(f'{method.upper()} {url} failed ({e}), retrying in {round(delay, 2)} seconds')
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                except Exception:
+                    self.__releaseSlot(started, error=True)
+                    raise
+
+                self.__releaseSlot(started, status_code=result.status_code)
+
+                with self.__lock:
+                    self.__api_calls += 1
+                self.__last_execution_time = result.elapsed
+
+                if self.__circuit_breaker is not None:
+                    if result.status_code >= 500:
+                        self.__circuit_breaker.recordFailure(self.__breaker_host)
+                    else:
+                        self.__circuit_breaker.recordSuccess(self.__breaker_host)
+                recorded = True
+            finally:
+                if self.__circuit_breaker is not None and not recorded:
+                    self.__circuit_breaker.releaseProbe(self.__breaker_host)
+
+            if self.__retry_policy is not None and self.__retry_policy.shouldRetry(method, attempt, status_code=result.status_code):
+                result.close()
+                delay = self.__retry_policy.getBackoff(attempt, self.__parseRetryAfter(result.headers))
+                logger.debug(f'{method.upper()} {url} returned {result.status_code}, retrying in {round(delay, 2)} seconds')
+                time.sleep(delay)
+                attempt += 1
+                continue
 
             if result.status_code != 429 or self.__isSkipRateLimitRetry:
-                if self.__isSimpleResponse:
+                if self.__isStreamResponse and method == 'get' and result.status_code < 400:
+                    return self.__streamResponse(result)
+                elif self.__isSimpleResponse:
                     return result.json()
                 else:
                     return ifbResponse(result.headers, result.status_code, result.json())
+            elif self.__rate_limiter is not None:
+                result.close()
+                logger.debug(f'{method.upper()} {url} rate limited, holding back shared permits')
+                self.__rate_limiter.penalize(self.__host, self.__parseRetryAfter(result.headers) or 60)
             else:
+                result.close()
                 print('Request rate limited, waiting 60 seconds then retrying...')
                 time.sleep(60)
 
+    def __releaseSlot(self, started, status_code=None, error=False):
+        if self.__concurrency is not None:
+            self.__concurrency.release(time.monotonic() - started, status_code, error)
+
+    def __streamResponse(self, result):
+        """Decode a list body item by item as it downloads instead of loading it whole"""
+        from .streaming import decodeStream
+
+        result.encoding = result.encoding or 'utf-8'
+        body, stream = decodeStream(result.iter_content(chunk_size=65536, decode_unicode=True))
+
+        if self.__isSimpleResponse:
+            return body if stream is None else stream
+        return ifbResponse(result.headers, result.status_code, body, stream)
+
+    def __parseRetryAfter(self, headers):
+        try:
+            return float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+
     __resources = {
         "Profiles": "profiles",
         "Profile": "profiles/%s",
@@ -246,583 +424,583 @@ class IFB():
     # Profiles
     ##############################
     def getProfiles(self, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, params=params)
+        return self.__request(sys._getframe().f_code.co_name, params=params)
 
     def getProfile(self, profile_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id,))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id,))
 
     def getHomeProfile(self):
-        return self.__request(inspect.currentframe().f_code.co_name)
+        return self.__request(sys._getframe().f_code.co_name)
 
     def postProfile(self, body):
-        return self.__request(f'{inspect.currentframe().f_code.co_name}s', body=body)
+        return self.__request(f'{sys._getframe().f_code.co_name}s', body=body)
 
     def putProfile(self, profile_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id,), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id,), body=body)
 
     ##############################
     # CompanyInfo
     ##############################
     def getCompanyInfo(self, profile_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), params=params)
 
     def putCompanyInfo(self, profile_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), body=body)
 
     ##############################
     # Users
     ##############################
     def getUsers(self, profile_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), params=params)
 
     def getUser(self, profile_id, user_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id))
 
     def postUsers(self, profile_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), body=body)
 
     def putUsers(self, profile_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), body=body, params=params)
 
     def putUser(self, profile_id, user_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id), body=body)
 
     def deleteUsers(self, profile_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), params=params)
 
     def deleteUser(self, profile_id, user_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id))
 
     ##############################
     # UserPageAssignments
     ##############################
     def getUserPageAssignments(self, profile_id, user_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id), params=params)
 
     def getUserPageAssignment(self, profile_id, user_id, page_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id, page_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id, page_id))
 
     def postUserPageAssignments(self, profile_id, user_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id), body=body)
 
     def putUserPageAssignments(self, profile_id, user_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id), body=body, params=params)
 
     def putUserPageAssignment(self, profile_id, user_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id, page_id), body=body)
 
     def deleteUserPageAssignments(self, profile_id, user_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id), params=params)
 
     def deleteUserPageAssignment(self, profile_id, user_id, page_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id, page_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id, page_id))
 
     ##############################
     # UserRecordAssignments
     ##############################
     def getUserRecordAssignments(self, profile_id, user_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id), params=params)
 
     def getUserRecordAssignment(self, profile_id, user_id, record_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id, record_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id, record_id))
 
     def postUserRecordAssignments(self, profile_id, user_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id), body=body)
 
     def deleteUserRecordAssignments(self, profile_id, user_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id), params=params)
 
     def deleteUserRecordAssignment(self, profile_id, user_id, record_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, user_id, record_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, user_id, record_id))
 
     ##############################
     # UserGroups
     ##############################
     def getUserGroups(self, profile_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), params=params)
 
     def getUserGroup(self, profile_id, usergroup_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id))
 
     def postUserGroups(self, profile_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), body=body)
 
     def putUserGroup(self, profile_id, usergroup_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body)
 
     def deleteUserGroup(self, profile_id, usergroup_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id))
 
     ##############################
     # UserGroupUserAssignments
     ##############################
     def getUserGroupUserAssignments(self, profile_id, usergroup_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id), params=params)
 
     def getUserGroupUserAssignment(self, profile_id, usergroup_id, user_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id, user_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id, user_id))
 
     def postUserGroupUserAssignments(self, profile_id, usergroup_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body)
 
     # def putUserGroupUserAssignments(self, profile_id, usergroup_id, body, params=None):
-    #     return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body, params=params)
+    #     return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body, params=params)
 
     # def putUserGroupUserAssignment(self, profile_id, usergroup_id, user_id, body):
-    #     return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id, user_id), body=body)
+    #     return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id, user_id), body=body)
 
     def deleteUserGroupUserAssignments(self, profile_id, usergroup_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id), params=params)
 
     def deleteUserGroupUserAssignment(self, profile_id, usergroup_id, user_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id, user_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id, user_id))
 
     ##############################
     # UserGroupPageAssignments
     ##############################
     def getUserGroupPageAssignments(self, profile_id, usergroup_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id), params=params)
 
     def getUserGroupPageAssignment(self, profile_id, usergroup_id, page_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id, page_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id, page_id))
 
     def postUserGroupPageAssignments(self, profile_id, usergroup_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body)
 
     def putUserGroupPageAssignments(self, profile_id, usergroup_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id), body=body, params=params)
 
     def putUserGroupPageAssignment(self, profile_id, usergroup_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id, page_id), body=body)
 
     def deleteUserGroupPageAssignments(self, profile_id, usergroup_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id), params=params)
 
     def deleteUserGroupPageAssignment(self, profile_id, usergroup_id, page_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, usergroup_id, page_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, usergroup_id, page_id))
 
     ##############################
     # Pages
     ##############################
     def getPages(self, profile_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), params=params)
 
     def getPage(self, profile_id, page_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id))
 
     def copyPage(self, profile_id, page_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id))
 
     def postPages(self, profile_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), body=body)
 
     def putPage(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
 
     def deletePage(self, profile_id, page_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id))
 
     ##############################
     # PageFeed
     ##############################
     def getPageFeed(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     ##############################
     # PageLocalizations
     ##############################
     def getPageLocalizations(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def getPageLocalization(self, profile_id, page_id, language_code):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, language_code))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, language_code))
 
     def postPageLocalizations(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
 
     def putPageLocalizations(self, profile_id, page_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
 
     def putPageLocalization(self, profile_id, page_id, language_code, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, language_code), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, language_code), body=body)
 
     def deletePageLocalizations(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def deletePageLocalization(self, profile_id, page_id, language_code):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, language_code))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, language_code))
 
     ##############################
     # PageUserAssignments
     ##############################
     def getPageUserAssignments(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
-    def getPageUserAssignments(self, profile_id, page_id, user_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, user_id))
+    def getPageUserAssignment(self, profile_id, page_id, user_id):
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, user_id))
 
     def postPageUserAssignments(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
     
     def putPageUserAssignments(self, profile_id, page_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
 
     def putPageUserAssignment(self, profile_id, page_id, user_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, user_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, user_id), body=body)
 
     def deletePageUserAssignments(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def deletePageUserAssignment(self, profile_id, page_id, user_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, user_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, user_id))
 
     ##############################
     # PageRecordAssignments
     ##############################
     def getPageRecordAssignments(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def deletePageRecordAssignments(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     ##############################
     # PageEndpoints
     ##############################
     def getPageEndpoints(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def getPageEndpoint(self, profile_id, page_id, endpoint_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, endpoint_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, endpoint_id))
 
     def postPageEndpoints(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
 
     def putPageEndpoint(self, profile_id, page_id, endpoint_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, endpoint_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, endpoint_id), body=body)
 
     def deletePageEndpoints(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def deletePageEndpoint(self, profile_id, page_id, endpoint_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, endpoint_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, endpoint_id))
 
     ##############################
     # PageEmailAlerts
     ##############################
     def getPageEmailAlerts(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def postPageEmailAlerts(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
 
     def deletePageEmailAlerts(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     ##############################
     # PageTriggerPost
     ##############################
     def postPageTriggerPost(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
 
     ##############################
     # PageShares
     ##############################
     def getPageShares(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def postPageShares(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
 
     def putPageShares(self, profile_id, page_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
 
     def deletePageShares(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     ##############################
     # PageDynamicAttributes
     ##############################
     def getPageDynamicAttributes(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def getPageDynamicAttribute(self, profile_id, page_id, attribute_name):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, attribute_name))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, attribute_name))
 
     def postPageDynamicAttributes(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
     
     def putPageDynamicAttributes(self, profile_id, page_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
 
     def putPageDynamicAttribute(self, profile_id, page_id, attribute_name, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, attribute_name), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, attribute_name), body=body)
 
     def deletePageDynamicAttributes(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def deletePageDynamicAttribute(self, profile_id, page_id, attribute_name):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, attribute_name))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, attribute_name))
 
     ##############################
     # PageGroups
     ##############################
     def getPageGroups(self, profile_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), params=params)
 
     def getPageGroup(self, profile_id, pagegroup_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id))
 
     def postPageGroups(self, profile_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), body=body)
 
     def putPageGroup(self, profile_id, pagegroup_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id), body=body)
 
     def deletePageGroup(self, profile_id, pagegroup_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id))
 
     ##############################
     # PageGroupPageAssignments
     ##############################
     def getPageGroupPageAssignments(self, profile_id, pagegroup_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id))
 
     def postPageGroupPageAssignments(self, profile_id, pagegroup_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id), body=body)
 
     def deletePageGroupPageAssignments(self, profile_id, pagegroup_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id, page_id), body=body)
 
     ##############################
     # PageGroupUserAssignments
     ##############################
     def getPageGroupUserAssignments(self, profile_id, pagegroup_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id), params=params)
 
     def getPageGroupUserAssignment(self, profile_id, pagegroup_id, user_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id, user_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id, user_id))
 
     def postPageGroupUserAssignments(self, profile_id, pagegroup_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id), body=body)
     
     def putPageGroupUserAssignments(self, profile_id, pagegroup_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id), body=body, params=params)
 
     def putPageGroupUserAssignment(self, profile_id, pagegroup_id, user_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id, user_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id, user_id), body=body)
 
     def deletePageGroupUserAssignments(self, profile_id, pagegroup_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id), params=params)
 
     def deletePageGroupUserAssignment(self, profile_id, pagegroup_id, user_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, pagegroup_id, user_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, pagegroup_id, user_id))
 
     ##############################
     # Elements
     ##############################
     def getElements(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def getElement(self, profile_id, page_id, element_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id))
 
     def copyElement(self, profile_id, page_id, element_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id))
 
     def postElements(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
     
     def putElements(self, profile_id, page_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
 
     def putElement(self, profile_id, page_id, element_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body)
 
     def deleteElements(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def deleteElement(self, profile_id, page_id, element_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id))
 
     ##############################
     # ElementLocalizations
     ##############################
     def getElementLocalizations(self, profile_id, page_id, element_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id), params=params)
 
     def getElementLocalization(self, profile_id, page_id, element_id, language_code):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id, language_code))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id, language_code))
 
     def postElementLocalizations(self, profile_id, page_id, element_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body)
     
     def putElementLocalizations(self, profile_id, page_id, element_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body, params=params)
 
     def putElementLocalization(self, profile_id, page_id, element_id, language_code, body, ):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id, language_code), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id, language_code), body=body)
 
     def deleteElementLocalizations(self, profile_id, page_id, element_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id), params=params)
 
     def deleteElementLocalization(self, profile_id, page_id, element_id, language_code):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id, language_code))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id, language_code))
 
     ##############################
     # ElementDynamicAttributes
     ##############################
     def getElementDynamicAttributes(self, profile_id, page_id, element_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id), params=params)
 
     def getElementDynamicAttribute(self, profile_id, page_id, element_id, attribute_name):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id, attribute_name))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id, attribute_name))
 
     def postElementDynamicAttributes(self, profile_id, page_id, element_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body)
     
     def putElementDynamicAttributes(self, profile_id, page_id, element_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id), body=body, params=params)
 
     def putElementDynamicAttribute(self, profile_id, page_id, element_id, attribute_name, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id, attribute_name), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id, attribute_name), body=body)
 
     def deleteElementDynamicAttributes(self, profile_id, page_id, element_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id), params=params)
 
     def deleteElementDynamicAttribute(self, profile_id, page_id, element_id, attribute_name):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, element_id, attribute_name))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, element_id, attribute_name))
 
     ##############################
     # OptionLists
     ##############################
     def getOptionLists(self, profile_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), params=params)
 
     def getOptionList(self, profile_id, optionlist_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id))
 
     def copyOptionList(self, profile_id, optionlist_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id))
 
     def postOptionLists(self, profile_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), body=body)
     
     def putOptionList(self, profile_id, optionlist_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id), body=body)
 
     def deleteOptionList(self, profile_id, optionlist_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id))
 
     ##############################
     # Options
     ##############################
     def getOptions(self, profile_id, optionlist_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id), params=params)
 
     def getOption(self, profile_id, optionlist_id, option_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id))
 
     def postOptions(self, profile_id, optionlist_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id), body=body)
 
     def putOptions(self, profile_id, optionlist_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id), body=body, params=params)
 
     def putOption(self, profile_id, optionlist_id, option_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), body=body)
 
     def deleteOptions(self, profile_id, optionlist_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id), params=params)
 
     def deleteOption(self, profile_id, optionlist_id, option_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id))
 
     ##############################
     # OptionLocalizations
     ##############################
     def getOptionLocalizations(self, profile_id, optionlist_id, option_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), params=params)
 
     def getOptionLocalization(self, profile_id, optionlist_id, option_id, language_code):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id, language_code))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id, language_code))
 
     def postOptionLocalizations(self, profile_id, optionlist_id, option_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), body=body)
     
     def putOptionLocalizations(self, profile_id, optionlist_id, option_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), body=body, params=params)
 
     def putOptionLocalization(self, profile_id, optionlist_id, option_id, language_code, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id, language_code), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id, language_code), body=body)
 
     def deleteOptionLocalizations(self, profile_id, optionlist_id, option_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id), params=params)
 
     def deleteOptionLocalization(self, profile_id, optionlist_id, option_id, language_code):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id, language_code))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, optionlist_id, option_id, language_code))
 
     ##############################
     # Records
     ##############################
     def getRecords(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def getRecord(self, profile_id, page_id, record_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, record_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, record_id))
 
     def copyRecord(self, profile_id, page_id, record_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, record_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, record_id))
 
     def postRecords(self, profile_id, page_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body)
 
     def putRecords(self, profile_id, page_id, body, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), body=body, params=params)
 
     def putRecord(self, profile_id, page_id, record_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, record_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, record_id), body=body)
 
     def deleteRecords(self, profile_id, page_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id), params=params)
 
     def deleteRecord(self, profile_id, page_id, record_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, record_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, record_id))
 
     ##############################
     # RecordAssignments
     ##############################
     def getRecordAssignments(self, profile_id, page_id, record_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, record_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, record_id), params=params)
 
     def getRecordAssignment(self, profile_id, page_id, record_id, assignment_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, record_id, assignment_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, record_id, assignment_id))
 
     def postRecordAssignments(self, profile_id, page_id, record_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, record_id), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, record_id), body=body)
     
     def deleteRecordAssignments(self, profile_id, page_id, record_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, record_id), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, record_id), params=params)
 
     def deleteRecordAssignment(self, profile_id, page_id, record_id, assignment_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, page_id, record_id, assignment_id))
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, page_id, record_id, assignment_id))
 
     ##############################
     # Notifications
     ##############################
     def postNotifications(self, profile_id, body):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), body=body)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), body=body)
 
     ##############################
     # PrivateMedia
     ##############################
     def getPrivateMedia(self, profile_id, media_url):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), params={'URL': media_url})
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), params={'URL': media_url})
 
     ##############################
     # DeviceLicenses
     ##############################
     def getDeviceLicenses(self, profile_id, params=None):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, ), params=params)
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, ), params=params)
 
     def getDeviceLicense(self, profile_id, license_id):
-        return self.__request(inspect.currentframe().f_code.co_name, ids=(profile_id, license_id))
\ No newline at end of file
+        return self.__request(sys._getframe().f_code.co_name, ids=(profile_id, license_id))
\ No newline at end of file
@@ -0,0 +1,94 @@
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+
+class WorkQueue():
+    """Run IFB calls on a pool of worker threads, highest priority first
+    The queue is bounded: submit() blocks, or raises queue.Full when it cannot wait, once maxsize jobs are pending
+    """
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+    __STOP = 3
+
+    def __init__(self, api, workers:int=4, maxsize:int=100):
+        if workers < 1 or maxsize < 1:
+            raise ValueError("Invalid work queue size")
+
+        self.__api = api
+        self.__queue = queue.PriorityQueue(maxsize)
+        self.__counter = itertools.count()
+        self.__lock = threading.Lock()
+        self.__closed = False
+
+        self.__workers = [threading.Thread(target=self.__work, daemon=True) for _ in range(workers)]
+        for worker in self.__workers:
+            worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def __work(self):
+        while True:
+            priority, _, future, fn, args, kwargs = self.__queue.get()
+
+            try:
+                if priority == self.__STOP:
+                    return
+
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                self.__queue.task_done()
+
+    def submit(self, method, *args, priority:int=NORMAL, block:bool=True, timeout:float=None, **kwargs):
+        """Queue an IFB method, by name or as a callable, and return a Future for its result"""
+        if priority not in (self.HIGH, self.NORMAL, self.LOW):
+            raise ValueError("Invalid priority")
+
+        fn = getattr(self.__api, method) if isinstance(method, str) else method
+        future = Future()
+
+        # queued under the lock so shutdown() cannot put its stop items ahead of a submit in progress
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError("Work queue is shut down")
+            self.__queue.put((priority, next(self.__counter), future, fn, args, kwargs), block=block, timeout=timeout)
+
+        return future
+
+    def getPendingCount(self):
+        return self.__queue.qsize()
+
+    def join(self):
+        self.__queue.join()
+
+    def shutdown(self, wait:bool=True, cancel_pending:bool=False):
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+
+        if cancel_pending:
+            while True:
+                try:
+                    item = self.__queue.get_nowait()
+                except queue.Empty:
+                    break
+                item[2].cancel()
+                self.__queue.task_done()
+
+        for _ in self.__workers:
+            self.__queue.put((self.__STOP, next(self.__counter), None, None, (), {}))
+
+        if wait:
+            for worker in self.__workers:
+                worker.join()
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import MAX_LIMIT, FILTER_CHUNK_SIZE, ResponseError, checkResponse, chunks, buildFilter
+
+class WriteJournal():
+    """Append-only log of bulk write chunks, fsynced after every entry
+    A chunk is committed once its response is logged, failed when the server rejected it,
+    and in doubt when its intent was logged but the outcome never was
+    """
+    COMMITTED = 'committed'
+    FAILED = 'failed'
+    IN_DOUBT = 'in_doubt'
+
+    def __init__(self, path:str):
+        self.path = path
+        self.__chunks = {}
+        self.__lock = threading.Lock()
+        line = '\n'
+
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # a torn last line from a crash mid-write carries no outcome
+                        continue
+                    self.__apply(entry)
+
+        self.__file = open(path, 'a', encoding='utf-8')
+
+        # end a torn last line so the next entry starts on its own line
+        if self.__file.tell() and not line.endswith('\n'):
+            self.__file.write('\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __apply(self, entry):
+        chunk = self.__chunks.setdefault(entry['key'], {})
+        chunk.update(entry)
+        chunk['state'] = {'intent': self.IN_DOUBT, 'commit': self.COMMITTED, 'failure': self.FAILED}[entry['event']]
+
+    def __append(self, entry):
+        entry['time'] = time.time()
+        with self.__lock:
+            self.__file.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__apply(entry)
+
+    def close(self):
+        self.__file.close()
+
+    def getState(self, key:str):
+        chunk = self.__chunks.get(key)
+        return chunk['state'] if chunk else None
+
+    def getIds(self, key:str):
+        chunk = self.__chunks.get(key)
+        return chunk.get('ids', []) if chunk else []
+
+    def getInDoubt(self):
+        return [key for key, chunk in self.__chunks.items() if chunk['state'] == self.IN_DOUBT]
+
+    def recordIntent(self, key:str, operation:str, count:int):
+        self.__append({'event': 'intent', 'key': key, 'operation': operation, 'count': count})
+
+    def recordCommit(self, key:str, ids):
+        self.__append({'event': 'commit', 'key': key, 'ids': list(ids)})
+
+    def recordFailure(self, key:str, error:str):
+        self.__append({'event': 'failure', 'key': key, 'error': error})
+
+def chunkKey(operation:str, index:int, chunk):
+    digest = hashlib.sha1(json.dumps(chunk, sort_keys=True, separators=(',', ':')).encode()).hexdigest()[:16]
+    return f'{operation}:{index}:{digest}'
+
+class BulkWriter():
+    """Resumable postRecords/putRecords loads backed by a WriteJournal
+    Run the same input again after a crash: committed chunks are skipped, rejected chunks are retried,
+    in-doubt PUT chunks are re-applied and in-doubt POST chunks are re-checked through key_field,
+    a field holding a unique external key, so only records that never landed are posted. Without
+    key_field in-doubt POST chunks are reported and left alone rather than risk duplicates.
+    With workers, chunks are sent concurrently; progress is called with the size of each finished chunk
+    """
+    def __init__(self, api, profile_id, page_id, journal:WriteJournal, chunk_size:int=MAX_LIMIT, key_field:str=None, workers:int=1, progress=None):
+        if not 0 < chunk_size <= MAX_LIMIT:
+            raise ValueError("Invalid chunk size")
+
+        if workers < 1:
+            raise ValueError("Invalid worker count")
+
+        self.api = api
+        self.profile_id = profile_id
+        self.page_id = page_id
+        self.journal = journal
+        self.chunk_size = chunk_size
+        self.key_field = key_field
+        self.workers = workers
+        self.progress = progress
+
+    def __write(self, key, operation, count, send, known_ids=()):
+        """Log intent, send, and log the outcome; a 4xx is logged as a failure, anything else stays in doubt"""
+        self.journal.recordIntent(key, operation, count)
+
+        try:
+            created = checkResponse(send()) if count else []
+        except ResponseError as e:
+            if e.status_code is not None and e.status_code < 500:
+                self.journal.recordFailure(key, str(e))
+            raise
+
+        ids = list(known_ids) + ([r['id'] for r in created] if isinstance(created, list) else [])
+        self.journal.recordCommit(key, ids)
+        return ids
+
+    def __existing(self, chunk):
+        """Map key_field values of chunk that already exist on the page to their record ids"""
+        values = [record[self.key_field] for record in chunk]
+        existing = {}
+
+        for part in chunks(values, FILTER_CHUNK_SIZE):
+            params = {'fields': buildFilter(self.key_field, part), 'limit': MAX_LIMIT}
+            for record in checkResponse(self.api.getRecords(self.profile_id, self.page_id, params)):
+                existing[record[self.key_field]] = record['id']
+
+        return existing
+
+    def __postChunk(self, key, chunk):
+        state = self.journal.getState(key)
+
+        if state == WriteJournal.COMMITTED:
+            return 'skipped', self.journal.getIds(key)
+
+        if state == WriteJournal.IN_DOUBT:
+            if self.key_field is None:
+                return 'in_doubt', []
+
+            existing = self.__existing(chunk)
+            missing = [record for record in chunk if record[self.key_field] not in existing]
+            send = lambda: self.api.postRecords(self.profile_id, self.page_id, missing)
+            return 'rechecked', self.__write(key, 'post', len(missing), send, existing.values())
+
+        send = lambda: self.api.postRecords(self.profile_id, self.page_id, chunk)
+        return 'written', self.__write(key, 'post', len(chunk), send)
+
+    def __putChunk(self, key, chunk):
+        ids = [record['id'] for record in chunk]
+
+        if self.journal.getState(key) == WriteJournal.COMMITTED:
+            return 'skipped', ids
+
+        params = {'fields': buildFilter('id', ids), 'limit': len(chunk)}
+        self.__write(key, 'put', len(chunk), lambda: self.api.putRecords(self.profile_id, self.page_id, chunk, params))
+        return 'written', ids
+
+    def __run(self, operation, records, size, handle):
+        report = {'written': 0, 'skipped': 0, 'rechecked': 0, 'in_doubt': [], 'ids': []}
+        tasks = [(chunkKey(operation, index, chunk), chunk) for index, chunk in enumerate(chunks(records, size))]
+
+        def run(task):
+            outcome, ids = handle(*task)
+            if self.progress is not None:
+                self.progress(len(task[1]))
+            return task[0], outcome, ids
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            for key, outcome, ids in pool.map(run, tasks):
+                if outcome == 'in_doubt':
+                    report['in_doubt'].append(key)
+                else:
+                    report[outcome] += 1
+                report['ids'].extend(ids)
+
+        return report
+
+    def postRecords(self, records):
+        return self.__run('post', records, self.chunk_size, self.__postChunk)
+
+    def putRecords(self, records):
+        return self.__run('put', records, min(self.chunk_size, FILTER_CHUNK_SIZE), self.__putChunk)
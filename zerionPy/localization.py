@@ -0,0 +1,118 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import SUBFORM_DATA_TYPE, checkResponse, buildFilter, iterPages
+
+LOCALIZATION_FIELDS = 'language_code,label'
+
+# pack section: resource name used by the get/post/put *Localizations methods
+SECTIONS = {
+    'pages': 'Page',
+    'elements': 'Element',
+    'options': 'Option',
+}
+
+def _walkPages(api, profile_id, page_id, pool):
+    """Return [(section, ids)] for every localizable object of a page tree"""
+    objects, optionlists = [], set()
+    pending = [page_id]
+    seen = set()
+
+    while pending:
+        seen.update(pending)
+        results = pool.map(lambda p: (p, list(iterPages(api.getElements, profile_id, p, params={'fields': 'data_type,data_size,optionlist_id'}))), pending)
+        pending = []
+
+        for page, elements in results:
+            objects.append(('pages', (page,)))
+            for element in elements:
+                objects.append(('elements', (page, element['id'])))
+                if element.get('optionlist_id'):
+                    optionlists.add(element['optionlist_id'])
+                if element.get('data_type') == SUBFORM_DATA_TYPE and element['data_size'] not in seen:
+                    pending.append(element['data_size'])
+
+    for optionlist_id, options in pool.map(lambda o: (o, list(iterPages(api.getOptions, profile_id, o, params={'fields': 'key_value'}))), optionlists):
+        objects.extend(('options', (optionlist_id, option['id'])) for option in options)
+
+    return objects
+
+def _getLocalizations(api, profile_id, section, ids):
+    method = getattr(api, f'get{SECTIONS[section]}Localizations')
+    return list(iterPages(method, profile_id, *ids, params={'fields': LOCALIZATION_FIELDS}))
+
+def exportLocalizations(api, profile_id, page_id, directory:str, workers:int=8):
+    """Export every translation of a page tree, its elements and their options into one file per language
+    Returns {language_code: path}
+    """
+    packs = {}
+
+    with ThreadPoolExecutor(workers) as pool:
+        objects = _walkPages(api, profile_id, page_id, pool)
+        results = pool.map(lambda o: (o, _getLocalizations(api, profile_id, *o)), objects)
+
+        for (section, ids), localizations in results:
+            key = '/'.join(str(i) for i in ids)
+            for localization in localizations:
+                localization = dict(localization)
+                localization.pop('id', None)
+                language = localization.pop('language_code')
+                pack = packs.setdefault(language, {'language_code': language, 'profile_id': profile_id, 'page_id': page_id, **{s: {} for s in SECTIONS}})
+                pack[section][key] = localization
+
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for language, pack in packs.items():
+        paths[language] = os.path.join(directory, f'{language}.json')
+        with open(paths[language], 'w', encoding='utf-8') as f:
+            json.dump(pack, f, ensure_ascii=False, separators=(',', ':'))
+
+    return paths
+
+def _importObject(api, profile_id, section, ids, desired, dry_run):
+    current = {l['language_code']: l for l in _getLocalizations(api, profile_id, section, ids)}
+
+    inserts, updates = [], []
+    for language, localization in desired.items():
+        if language not in current:
+            inserts.append({'language_code': language, **localization})
+        elif any(current[language].get(k) != v for k, v in localization.items()):
+            updates.append({'language_code': language, **localization})
+
+    if not dry_run:
+        resource = SECTIONS[section]
+        if inserts:
+            checkResponse(getattr(api, f'post{resource}Localizations')(profile_id, *ids, inserts))
+        if updates:
+            params = {'fields': buildFilter('language_code', [l['language_code'] for l in updates]), 'limit': len(updates)}
+            checkResponse(getattr(api, f'put{resource}Localizations')(profile_id, *ids, updates, params))
+
+    return len(inserts), len(updates)
+
+def importLocalizations(api, profile_id, paths, workers:int=8, dry_run:bool=False):
+    """Apply localization pack files, writing only translations that are new or changed
+    All languages of an object go in one post and one put call; objects are processed concurrently
+    Returns {'inserted': n, 'updated': n, 'unchanged': n}
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+
+    objects = {}
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            pack = json.load(f)
+
+        for section in SECTIONS:
+            for key, localization in pack.get(section, {}).items():
+                ids = tuple(int(i) for i in key.split('/'))
+                objects.setdefault((section, ids), {})[pack['language_code']] = localization
+
+    with ThreadPoolExecutor(workers) as pool:
+        results = list(pool.map(lambda o: _importObject(api, profile_id, o[0][0], o[0][1], o[1], dry_run), objects.items()))
+
+    inserted = sum(r[0] for r in results)
+    updated = sum(r[1] for r in results)
+    total = sum(len(languages) for languages in objects.values())
+
+    return {'inserted': inserted, 'updated': updated, 'unchanged': total - inserted - updated}
@@ -0,0 +1,233 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import MAX_LIMIT, SUBFORM_DATA_TYPE, checkResponse, chunks, iterPages, runGraph, stripReadOnly
+from .options import syncOptions
+from .localization import _importObject
+
+ELEMENT_FIELDS = 'name,label,description,data_type,data_size,optionlist_id,sort_order,default_value,low_value,high_value,dynamic_value,condition_value,client_validation,validation_message,is_disabled,is_readonly,is_required,is_action,is_encrypt,is_hide_typing,on_change,keyboard_type,dynamic_label,weighted_score,attachment_link,reference_id_1,reference_id_2,reference_id_3,reference_id_4,reference_id_5'
+OPTION_FIELDS = 'key_value,label,sort_order,condition_value,score'
+LOCALIZATION_FIELDS = 'language_code,label'
+DYNAMIC_ATTRIBUTE_FIELDS = 'name,value'
+
+class Migration():
+    """Copy pages, with their subforms, option lists, localizations and dynamic attributes, to another profile or server
+    The source is snapshotted with the get* methods, then objects are created on the target in dependency order,
+    independent objects concurrently, with ids remapped along the way. With reuse_optionlists, option lists that
+    already exist on the target by name get the missing and changed options instead of being duplicated; options
+    that only exist on the target are kept, since other forms may use them
+    """
+    def __init__(self, source, target, source_profile_id, target_profile_id, workers:int=8, localizations:bool=True, dynamic_attributes:bool=True, reuse_optionlists:bool=False):
+        if workers < 1:
+            raise ValueError("Invalid worker count")
+
+        self.source = source
+        self.target = target
+        self.source_profile_id = source_profile_id
+        self.target_profile_id = target_profile_id
+        self.workers = workers
+        self.localizations = localizations
+        self.dynamic_attributes = dynamic_attributes
+        self.reuse_optionlists = reuse_optionlists
+
+        self.snapshot = None
+        self.id_map = {'pages': {}, 'elements': {}, 'optionlists': {}, 'options': {}}
+        self.__lock = threading.Lock()
+
+    ##############################
+    # Snapshot
+    ##############################
+    def __fetchPage(self, page_id):
+        page = checkResponse(self.source.getPage(self.source_profile_id, page_id))
+        elements = list(iterPages(self.source.getElements, self.source_profile_id, page_id, params={'fields': ELEMENT_FIELDS}))
+        return page, sorted(elements, key=lambda e: e.get('sort_order', 0))
+
+    def __fetchOptionList(self, optionlist_id):
+        optionlist = checkResponse(self.source.getOptionList(self.source_profile_id, optionlist_id))
+        options = list(iterPages(self.source.getOptions, self.source_profile_id, optionlist_id, params={'fields': OPTION_FIELDS}))
+        return optionlist, options
+
+    def __fetchAll(self, method, *ids, fields):
+        return list(iterPages(method, self.source_profile_id, *ids, params={'fields': fields}))
+
+    def takeSnapshot(self, page_ids):
+        snapshot = {
+            'pages': {},
+            'elements': {},
+            'optionlists': {},
+            'options': {},
+            'page_localizations': {},
+            'element_localizations': {},
+            'option_localizations': {},
+            'page_dynamic_attributes': {},
+            'element_dynamic_attributes': {},
+        }
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            pending = set(page_ids)
+            while pending:
+                for page, elements in pool.map(self.__fetchPage, pending):
+                    snapshot['pages'][page['id']] = page
+                    snapshot['elements'][page['id']] = elements
+
+                pending = {e['data_size'] for elements in snapshot['elements'].values() for e in elements if e.get('data_type') == SUBFORM_DATA_TYPE} - set(snapshot['pages'])
+
+            optionlist_ids = {e['optionlist_id'] for elements in snapshot['elements'].values() for e in elements if e.get('optionlist_id')}
+            for optionlist, options in pool.map(self.__fetchOptionList, optionlist_ids):
+                snapshot['optionlists'][optionlist['id']] = optionlist
+                snapshot['options'][optionlist['id']] = options
+
+            fetches = {}
+            for page_id, elements in snapshot['elements'].items():
+                if self.localizations:
+                    fetches[('page_localizations', page_id)] = pool.submit(self.__fetchAll, self.source.getPageLocalizations, page_id, fields=LOCALIZATION_FIELDS)
+                if self.dynamic_attributes:
+                    fetches[('page_dynamic_attributes', page_id)] = pool.submit(self.__fetchAll, self.source.getPageDynamicAttributes, page_id, fields=DYNAMIC_ATTRIBUTE_FIELDS)
+
+                for element in elements:
+                    if self.localizations:
+                        fetches[('element_localizations', element['id'])] = pool.submit(self.__fetchAll, self.source.getElementLocalizations, page_id, element['id'], fields=LOCALIZATION_FIELDS)
+                    if self.dynamic_attributes:
+                        fetches[('element_dynamic_attributes', element['id'])] = pool.submit(self.__fetchAll, self.source.getElementDynamicAttributes, page_id, element['id'], fields=DYNAMIC_ATTRIBUTE_FIELDS)
+
+            if self.localizations:
+                for optionlist_id, options in snapshot['options'].items():
+                    for option in options:
+                        fetches[('option_localizations', option['id'])] = pool.submit(self.__fetchAll, self.source.getOptionLocalizations, optionlist_id, option['id'], fields=LOCALIZATION_FIELDS)
+
+            for (section, object_id), future in fetches.items():
+                result = future.result()
+                if result:
+                    snapshot[section][object_id] = result
+
+        self.snapshot = snapshot
+        return snapshot
+
+    ##############################
+    # Create
+    ##############################
+    def __mapIds(self, section, source_ids, created):
+        ids = [item['id'] for item in created]
+        with self.__lock:
+            self.id_map[section].update(zip(source_ids, ids))
+
+    def __reuseOptionList(self, optionlist_id, target_id, options):
+        """Add missing and changed options to a target list of the same name, leaving its other options alone"""
+        syncOptions(self.target, self.target_profile_id, target_id, options, delete_missing=False)
+
+        target_options = {o['key_value']: o['id'] for o in iterPages(self.target.getOptions, self.target_profile_id, target_id, params={'fields': 'key_value'})}
+        source_options = self.snapshot['options'][optionlist_id]
+
+        with self.__lock:
+            self.id_map['optionlists'][optionlist_id] = target_id
+            self.id_map['options'].update({o['id']: target_options[o['key_value']] for o in source_options})
+
+        for option in source_options:
+            localizations = self.snapshot['option_localizations'].get(option['id'])
+            if localizations:
+                desired = {l['language_code']: stripReadOnly({k: v for k, v in l.items() if k != 'language_code'}) for l in localizations}
+                _importObject(self.target, self.target_profile_id, 'options', (target_id, target_options[option['key_value']]), desired, False)
+
+    def __createOptionList(self, optionlist_id, existing):
+        optionlist = self.snapshot['optionlists'][optionlist_id]
+        options = [stripReadOnly(option) for option in self.snapshot['options'][optionlist_id]]
+
+        if optionlist['name'] in existing:
+            self.__reuseOptionList(optionlist_id, existing[optionlist['name']], options)
+            return
+
+        target_id = checkResponse(self.target.postOptionLists(self.target_profile_id, stripReadOnly(optionlist)))['id']
+        with self.__lock:
+            self.id_map['optionlists'][optionlist_id] = target_id
+
+        source_options = self.snapshot['options'][optionlist_id]
+        for offset, chunk in zip(range(0, len(options), MAX_LIMIT), chunks(options, MAX_LIMIT)):
+            created = checkResponse(self.target.postOptions(self.target_profile_id, target_id, chunk))
+            self.__mapIds('options', [o['id'] for o in source_options[offset:offset + MAX_LIMIT]], created)
+
+        for option in source_options:
+            localizations = self.snapshot['option_localizations'].get(option['id'])
+            if localizations:
+                checkResponse(self.target.postOptionLocalizations(self.target_profile_id, target_id, self.id_map['options'][option['id']], [stripReadOnly(item) for item in localizations]))
+
+    def __createPage(self, page_id):
+        page = checkResponse(self.target.postPages(self.target_profile_id, stripReadOnly(self.snapshot['pages'][page_id])))
+        with self.__lock:
+            self.id_map['pages'][page_id] = page['id']
+
+        target_id = page['id']
+        localizations = self.snapshot['page_localizations'].get(page_id)
+        if localizations:
+            checkResponse(self.target.postPageLocalizations(self.target_profile_id, target_id, [stripReadOnly(item) for item in localizations]))
+
+        attributes = self.snapshot['page_dynamic_attributes'].get(page_id)
+        if attributes:
+            checkResponse(self.target.postPageDynamicAttributes(self.target_profile_id, target_id, [stripReadOnly(item) for item in attributes]))
+
+    def __createElements(self, page_id):
+        target_page_id = self.id_map['pages'][page_id]
+        source_elements = self.snapshot['elements'][page_id]
+        elements = []
+
+        for element in source_elements:
+            element = stripReadOnly(element)
+            if element.get('optionlist_id'):
+                element['optionlist_id'] = self.id_map['optionlists'][element['optionlist_id']]
+            if element.get('data_type') == SUBFORM_DATA_TYPE:
+                element['data_size'] = self.id_map['pages'][element['data_size']]
+            elements.append(element)
+
+        for offset, chunk in zip(range(0, len(elements), MAX_LIMIT), chunks(elements, MAX_LIMIT)):
+            created = checkResponse(self.target.postElements(self.target_profile_id, target_page_id, chunk))
+            self.__mapIds('elements', [e['id'] for e in source_elements[offset:offset + MAX_LIMIT]], created)
+
+    def __createElementExtras(self, element_id, page_id):
+        target_page_id = self.id_map['pages'][page_id]
+        target_element_id = self.id_map['elements'][element_id]
+
+        localizations = self.snapshot['element_localizations'].get(element_id)
+        if localizations:
+            checkResponse(self.target.postElementLocalizations(self.target_profile_id, target_page_id, target_element_id, [stripReadOnly(item) for item in localizations]))
+
+        attributes = self.snapshot['element_dynamic_attributes'].get(element_id)
+        if attributes:
+            checkResponse(self.target.postElementDynamicAttributes(self.target_profile_id, target_page_id, target_element_id, [stripReadOnly(item) for item in attributes]))
+
+    def buildGraph(self):
+        """Return the creation tasks keyed by object, each with the keys of the tasks it depends on"""
+        if self.snapshot is None:
+            raise ValueError("Take a snapshot before migrating")
+
+        existing = {}
+        if self.reuse_optionlists and self.snapshot['optionlists']:
+            existing = {o['name']: o['id'] for o in iterPages(self.target.getOptionLists, self.target_profile_id, params={'fields': 'name'})}
+
+        tasks = {}
+
+        for optionlist_id in self.snapshot['optionlists']:
+            tasks[('optionlist', optionlist_id)] = (lambda i=optionlist_id: self.__createOptionList(i, existing), ())
+
+        for page_id, elements in self.snapshot['elements'].items():
+            tasks[('page', page_id)] = (lambda i=page_id: self.__createPage(i), ())
+
+            dependencies = {('page', page_id)}
+            for element in elements:
+                if element.get('optionlist_id'):
+                    dependencies.add(('optionlist', element['optionlist_id']))
+                if element.get('data_type') == SUBFORM_DATA_TYPE:
+                    dependencies.add(('page', element['data_size']))
+            tasks[('elements', page_id)] = (lambda i=page_id: self.__createElements(i), tuple(dependencies))
+
+            for element in elements:
+                if element['id'] in self.snapshot['element_localizations'] or element['id'] in self.snapshot['element_dynamic_attributes']:
+                    tasks[('element', element['id'])] = (lambda e=element['id'], p=page_id: self.__createElementExtras(e, p), (('elements', page_id),))
+
+        return tasks
+
+    def run(self, page_ids=None):
+        """Migrate the given pages (or the current snapshot) and return the source to target id map"""
+        if page_ids is not None:
+            self.takeSnapshot(page_ids)
+
+        runGraph(self.buildGraph(), self.workers)
+        return self.id_map
@@ -0,0 +1,70 @@
+from .utils import MAX_LIMIT, FILTER_CHUNK_SIZE, checkResponse, chunks, buildFilter, iterPages
+
+def diffOptions(current, desired, delete_missing:bool=True):
+    """Compare option lists indexed by key_value
+    Only the fields present on a desired option are compared, so partial options leave other fields alone
+    Returns (inserts, updates, deletes) where updates carry the option id and the changed fields only
+    """
+    index = {}
+    for option in current:
+        index[option['key_value']] = option
+
+    inserts, updates, seen = [], [], set()
+
+    for option in desired:
+        key_value = option.get('key_value')
+        if key_value is None:
+            raise ValueError("Desired options require a key_value")
+        if key_value in seen:
+            raise ValueError(f"Duplicate key_value: {key_value}")
+        seen.add(key_value)
+
+        existing = index.get(key_value)
+        if existing is None:
+            inserts.append(dict(option))
+            continue
+
+        changes = {k: v for k, v in option.items() if k not in ('id', 'key_value') and existing.get(k) != v}
+        if changes:
+            updates.append({'id': existing['id'], **changes})
+
+    deletes = [option['id'] for key_value, option in index.items() if key_value not in seen] if delete_missing else []
+
+    return inserts, updates, deletes
+
+def syncOptions(api, profile_id, optionlist_id, desired, delete_missing:bool=True, dry_run:bool=False, chunk_size:int=MAX_LIMIT):
+    """Make an option list match desired using the fewest calls
+    The current list is read with paginated getOptions, then inserts, updates and deletes are applied
+    in batches through postOptions, putOptions and deleteOptions. Nothing is written when the lists already match
+    """
+    desired = list(desired)
+    fields = {'key_value'}
+    for option in desired:
+        fields.update(option)
+    fields.discard('id')
+
+    current = list(iterPages(api.getOptions, profile_id, optionlist_id, params={'fields': ','.join(sorted(fields))}, limit=MAX_LIMIT))
+    inserts, updates, deletes = diffOptions(current, desired, delete_missing)
+
+    report = {
+        'inserted': inserts,
+        'updated': updates,
+        'deleted': deletes,
+        'unchanged': len(desired) - len(inserts) - len(updates),
+    }
+
+    if dry_run:
+        return report
+
+    for chunk in chunks(inserts, chunk_size):
+        checkResponse(api.postOptions(profile_id, optionlist_id, chunk))
+
+    for chunk in chunks(updates, min(chunk_size, FILTER_CHUNK_SIZE)):
+        params = {'fields': buildFilter('id', [option['id'] for option in chunk]), 'limit': len(chunk)}
+        checkResponse(api.putOptions(profile_id, optionlist_id, chunk, params))
+
+    for chunk in chunks(deletes, FILTER_CHUNK_SIZE):
+        params = {'fields': buildFilter('id', chunk), 'limit': len(chunk)}
+        checkResponse(api.deleteOptions(profile_id, optionlist_id, params))
+
+    return report
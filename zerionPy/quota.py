@@ -0,0 +1,144 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+class QuotaExceededError(Exception):
+    def __init__(self, server:str, job:str, usage:int, limit:int):
+        self.server = server
+        self.job = job
+        self.usage = usage
+        self.limit = limit
+        super().__init__(f'API quota exceeded for {server}{"/" + job if job else ""}: {usage} of {limit} calls used today')
+
+class QuotaLedger():
+    """Daily API call ledger stored in SQLite so that every process on the host records into the same totals
+    Budgets are set per server, optionally narrowed to a job. Hard limits refuse every call,
+    soft limits refuse or throttle low priority calls so interactive work keeps its share
+    """
+    HIGH = 'high'
+    NORMAL = 'normal'
+    LOW = 'low'
+
+    REFUSE = 'refuse'
+    THROTTLE = 'throttle'
+
+    def __init__(self, path:str='zerionpy_quota.db', throttle_delay:float=1.0, timeout:float=30):
+        self.path = path
+        self.throttle_delay = throttle_delay
+        self.timeout = timeout
+
+        self.__local = threading.local()
+
+        with self.__transaction() as db:
+            db.execute('CREATE TABLE IF NOT EXISTS usage (day TEXT, server TEXT, job TEXT, calls INTEGER, PRIMARY KEY (day, server, job))')
+            db.execute('CREATE TABLE IF NOT EXISTS budgets (server TEXT, job TEXT, hard_limit INTEGER, soft_limit INTEGER, soft_action TEXT, PRIMARY KEY (server, job))')
+
+    def __connection(self):
+        if getattr(self.__local, 'db', None) is None:
+            self.__local.db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        return self.__local.db
+
+    @contextmanager
+    def __transaction(self):
+        db = self.__connection()
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            yield db
+        except BaseException:
+            db.execute('ROLLBACK')
+            raise
+        else:
+            db.execute('COMMIT')
+
+    def __today(self):
+        return time.strftime('%Y-%m-%d', time.gmtime())
+
+    def __usage(self, db, server, job, day):
+        if job is None:
+            row = db.execute('SELECT SUM(calls) FROM usage WHERE day = ? AND server = ?', (day, server)).fetchone()
+        else:
+            row = db.execute('SELECT calls FROM usage WHERE day = ? AND server = ? AND job = ?', (day, server, job)).fetchone()
+        return (row[0] or 0) if row else 0
+
+    def __budget(self, db, server, job):
+        return db.execute('SELECT hard_limit, soft_limit, soft_action FROM budgets WHERE server = ? AND job = ?', (server, job or '')).fetchone()
+
+    def setBudget(self, server:str, hard_limit:int, soft_limit:int=None, job:str=None, soft_action:str='refuse'):
+        if hard_limit is None or hard_limit < 0 or (soft_limit is not None and not 0 <= soft_limit <= hard_limit):
+            raise ValueError("Invalid budget limits")
+
+        if soft_action not in (self.REFUSE, self.THROTTLE):
+            raise ValueError("Invalid soft action")
+
+        with self.__transaction() as db:
+            db.execute('INSERT OR REPLACE INTO budgets VALUES (?, ?, ?, ?, ?)', (server, job or '', hard_limit, soft_limit, soft_action))
+
+    def removeBudget(self, server:str, job:str=None):
+        with self.__transaction() as db:
+            db.execute('DELETE FROM budgets WHERE server = ? AND job = ?', (server, job or ''))
+
+    def getBudget(self, server:str, job:str=None):
+        budget = self.__budget(self.__connection(), server, job)
+        if budget is None:
+            return None
+        return {'hard_limit': budget[0], 'soft_limit': budget[1], 'soft_action': budget[2]}
+
+    def getUsage(self, server:str, job:str=None, day:str=None):
+        return self.__usage(self.__connection(), server, job, day or self.__today())
+
+    def getRemaining(self, server:str, job:str=None, soft:bool=False):
+        """Return the calls left today under the server budget and, if given, the job budget
+        None is returned when no budget applies
+        """
+        db = self.__connection()
+        day = self.__today()
+        remaining = None
+
+        for scope in (None, job) if job else (None,):
+            budget = self.__budget(db, server, scope)
+            if budget is None:
+                continue
+
+            limit = budget[1] if soft and budget[1] is not None else budget[0]
+            left = max(0, limit - self.__usage(db, server, scope, day))
+            remaining = left if remaining is None else min(remaining, left)
+
+        return remaining
+
+    def record(self, server:str, job:str=None, calls:int=1):
+        with self.__transaction() as db:
+            self.__record(db, server, job, calls)
+
+    def __record(self, db, server, job, calls):
+        db.execute('INSERT INTO usage VALUES (?, ?, ?, ?) ON CONFLICT (day, server, job) DO UPDATE SET calls = calls + excluded.calls', (self.__today(), server, job or '', calls))
+
+    def acquire(self, server:str, job:str=None, priority:str='normal'):
+        """Check the budgets and record one call in a single transaction
+        Raises QuotaExceededError when the call is refused, sleeps when it is throttled
+        """
+        throttle = False
+
+        with self.__transaction() as db:
+            day = self.__today()
+
+            for scope in (None, job) if job else (None,):
+                budget = self.__budget(db, server, scope)
+                if budget is None:
+                    continue
+
+                hard_limit, soft_limit, soft_action = budget
+                usage = self.__usage(db, server, scope, day)
+
+                if usage >= hard_limit:
+                    raise QuotaExceededError(server, scope, usage, hard_limit)
+
+                if soft_limit is not None and usage >= soft_limit and priority == self.LOW:
+                    if soft_action == self.REFUSE:
+                        raise QuotaExceededError(server, scope, usage, soft_limit)
+                    throttle = True
+
+            self.__record(db, server, job, 1)
+
+        if throttle:
+            time.sleep(self.throttle_delay)
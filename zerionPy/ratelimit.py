@@ -0,0 +1,66 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+class SharedRateLimiter():
+    """Request permits shared by every process on the host through a SQLite file
+    Each acquire() reserves the next free slot under a write lock (GCRA), so callers are served
+    in the order they ask and the combined rate stays at rate per `per` seconds. After a 429,
+    penalize() pushes every process's next slot back once instead of each sleeping on its own
+    """
+    def __init__(self, path:str='zerionpy_ratelimit.db', rate:float=10, per:float=1.0, burst:int=1, timeout:float=30):
+        if rate <= 0 or per <= 0 or burst < 1:
+            raise ValueError("Invalid rate limit values")
+
+        self.path = path
+        self.interval = per / rate
+        self.burst = burst
+        self.timeout = timeout
+
+        self.__local = threading.local()
+
+        with self.__transaction() as db:
+            db.execute('CREATE TABLE IF NOT EXISTS slots (key TEXT PRIMARY KEY, tat REAL)')
+
+    def __connection(self):
+        if getattr(self.__local, 'db', None) is None:
+            self.__local.db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        return self.__local.db
+
+    @contextmanager
+    def __transaction(self):
+        db = self.__connection()
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            yield db
+        except BaseException:
+            db.execute('ROLLBACK')
+            raise
+        else:
+            db.execute('COMMIT')
+
+    def __getTat(self, db, key):
+        row = db.execute('SELECT tat FROM slots WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else 0
+
+    def reserve(self, key:str):
+        """Reserve the next permit for key and return how many seconds to wait before using it"""
+        with self.__transaction() as db:
+            now = time.time()
+            tat = max(self.__getTat(db, key), now)
+            db.execute('INSERT OR REPLACE INTO slots VALUES (?, ?)', (key, tat + self.interval))
+
+        return max(0, tat - now - (self.burst - 1) * self.interval)
+
+    def acquire(self, key:str):
+        delay = self.reserve(key)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def penalize(self, key:str, seconds:float):
+        """Hold back every permit for key for the next seconds"""
+        with self.__transaction() as db:
+            tat = max(self.__getTat(db, key), time.time() + seconds)
+            db.execute('INSERT OR REPLACE INTO slots VALUES (?, ?)', (key, tat))
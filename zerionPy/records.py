@@ -0,0 +1,60 @@
+from .utils import MAX_LIMIT, checkResponse, getTotalCount, joinFields
+
+def countRecords(api, profile_id, page_id, fields:str=None):
+    """Count the records matching a fields grammar filter from Total-Count with a single limit=1 query"""
+    return getTotalCount(api.getRecords(profile_id, page_id, {'fields': joinFields('id', fields), 'limit': 1}))
+
+def _rangeFilter(lower, upper):
+    conditions = []
+    if lower is not None:
+        conditions.append(f'(>"{lower}")')
+    if upper is not None:
+        conditions.append(f'(<="{upper}")')
+    return f'id({"&".join(conditions)})' if conditions else 'id'
+
+def _applyInRanges(api, profile_id, page_id, fields, chunk_size, apply):
+    """Walk the matching records in id ranges of at most chunk_size and call apply with each range's filter
+    The upper bound of a range is found by reading the id at offset chunk_size - 1 past the previous range
+    """
+    lower, chunks, affected = None, 0, 0
+
+    while True:
+        after = f'(>"{lower}")' if lower is not None else ''
+        probe = checkResponse(api.getRecords(profile_id, page_id, {'fields': joinFields(f'id:<{after}', fields), 'limit': 1, 'offset': chunk_size - 1}))
+        upper = probe[0]['id'] if probe else None
+
+        result = checkResponse(apply({'fields': joinFields(_rangeFilter(lower, upper), fields), 'limit': chunk_size}))
+        chunks += 1
+        affected += len(result) if isinstance(result, list) else 0
+
+        if upper is None:
+            return chunks, affected
+
+        lower = upper
+
+def _bulk(api, profile_id, page_id, fields, chunk_size, dry_run, apply):
+    if not fields:
+        raise ValueError("A fields filter is required for bulk record operations")
+
+    if not 0 < chunk_size <= MAX_LIMIT:
+        raise ValueError("Invalid chunk size")
+
+    count = countRecords(api, profile_id, page_id, fields)
+
+    if dry_run or count == 0:
+        return {'count': count, 'chunks': -(-count // chunk_size), 'affected': 0, 'dry_run': dry_run}
+
+    chunks, affected = _applyInRanges(api, profile_id, page_id, fields, chunk_size, apply)
+    return {'count': count, 'chunks': chunks, 'affected': affected, 'dry_run': dry_run}
+
+def bulkDeleteRecords(api, profile_id, page_id, fields:str, chunk_size:int=MAX_LIMIT, dry_run:bool=False):
+    """Delete every record matching a fields grammar filter, one id range per call
+    With dry_run only the matching count is returned
+    """
+    return _bulk(api, profile_id, page_id, fields, chunk_size, dry_run, lambda params: api.deleteRecords(profile_id, page_id, params))
+
+def bulkUpdateRecords(api, profile_id, page_id, body:dict, fields:str, chunk_size:int=MAX_LIMIT, dry_run:bool=False):
+    """Apply body to every record matching a fields grammar filter, one id range per call
+    With dry_run only the matching count is returned
+    """
+    return _bulk(api, profile_id, page_id, fields, chunk_size, dry_run, lambda params: api.putRecords(profile_id, page_id, body, params))
@@ -0,0 +1,123 @@
+import random
+import threading
+import time
+
+class CircuitOpenError(Exception):
+    def __init__(self, host:str, retry_after:float):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f'Circuit open for {host}, retry in {round(retry_after, 2)} seconds')
+
+class RetryPolicy():
+    def __init__(self, max_retries:int=3, backoff_factor:float=0.5, max_backoff:float=30, jitter:bool=True, retry_statuses:tuple=(500, 502, 503, 504), retry_methods:tuple=('get', 'put', 'delete')):
+        if max_retries < 0 or backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("Invalid retry policy values")
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_methods = tuple(m.lower() for m in retry_methods)
+
+    def shouldRetry(self, method:str, attempt:int, status_code:int=None, error:Exception=None, sent:bool=True):
+        """Decide whether a failed attempt may be repeated
+        Non-idempotent methods (POST, copy) are only retried when the request never reached the server
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        if method.lower() not in self.retry_methods and sent:
+            return False
+
+        if error is not None:
+            return True
+
+        return status_code in self.retry_statuses
+
+    def getBackoff(self, attempt:int, retry_after:float=None):
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+
+        return delay
+
+class CircuitBreaker():
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold:int=5, recovery_timeout:float=30):
+        if failure_threshold < 1 or recovery_timeout < 0:
+            raise ValueError("Invalid circuit breaker values")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self.__lock = threading.Lock()
+        self.__hosts = {}
+
+    def __getHost(self, host):
+        return self.__hosts.setdefault(host, {'state': self.CLOSED, 'failures': 0, 'opened_at': None, 'probing': False})
+
+    def getState(self, host:str):
+        with self.__lock:
+            state = self.__getHost(host)
+
+            if state['state'] == self.OPEN and time.monotonic() - state['opened_at'] >= self.recovery_timeout:
+                return self.HALF_OPEN
+
+            return state['state']
+
+    def allowRequest(self, host:str):
+        """Return True if a request to host may be sent
+        Once the recovery timeout passes, a single probe request is let through to test the host
+        """
+        with self.__lock:
+            state = self.__getHost(host)
+
+            if state['state'] == self.CLOSED:
+                return True
+
+            if state['state'] == self.OPEN:
+                if time.monotonic() - state['opened_at'] < self.recovery_timeout:
+                    return False
+                state['state'] = self.HALF_OPEN
+                state['probing'] = False
+
+            if state['probing']:
+                return False
+
+            state['probing'] = True
+            return True
+
+    def releaseProbe(self, host:str):
+        """Give back the half-open probe of a request that ended without an outcome for the host"""
+        with self.__lock:
+            self.__getHost(host)['probing'] = False
+
+    def getRetryAfter(self, host:str):
+        with self.__lock:
+            state = self.__getHost(host)
+
+            if state['opened_at'] is None:
+                return 0
+
+            return max(0, self.recovery_timeout - (time.monotonic() - state['opened_at']))
+
+    def recordSuccess(self, host:str):
+        with self.__lock:
+            state = self.__getHost(host)
+            state.update({'state': self.CLOSED, 'failures': 0, 'opened_at': None, 'probing': False})
+
+    def recordFailure(self, host:str):
+        with self.__lock:
+            state = self.__getHost(host)
+            state['failures'] += 1
+
+            if state['state'] == self.HALF_OPEN or state['failures'] >= self.failure_threshold:
+                state.update({'state': self.OPEN, 'opened_at': time.monotonic(), 'probing': False})
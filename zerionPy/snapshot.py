@@ -0,0 +1,141 @@
+import gzip
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import checkResponse, iterPages
+from .migrate import ELEMENT_FIELDS, OPTION_FIELDS
+
+# section: list method, fields of the cheap list probe, get method, {child: (list method, fields, covered by probe)}
+# a page or option list whose probe fields are unchanged is reused from the base snapshot instead of fetched,
+# except for children that do not bump its version, which are always fetched again
+SECTIONS = {
+    'pages': ('getPages', 'version,modified_date', 'getPage', {
+        'elements': ('getElements', ELEMENT_FIELDS, True),
+        'endpoints': ('getPageEndpoints', 'url', False),
+        'email_alerts': ('getPageEmailAlerts', 'email', False),
+    }),
+    'optionlists': ('getOptionLists', 'version,modified_date', 'getOptionList', {
+        'options': ('getOptions', OPTION_FIELDS, True),
+    }),
+    'usergroups': ('getUserGroups', None, 'getUserGroup', {}),
+    'pagegroups': ('getPageGroups', None, 'getPageGroup', {}),
+}
+
+def _hash(value):
+    return hashlib.sha1(json.dumps(value, sort_keys=True, separators=(',', ':')).encode()).hexdigest()[:16]
+
+def _key(item):
+    return str(item['id']) if 'id' in item else _hash(item)
+
+def _stamp(item, fields):
+    if not fields:
+        return None
+    values = [item.get(f) for f in fields.split(',')]
+    return _hash(values) if any(v is not None for v in values) else None
+
+def _uncovered(section):
+    return [child for child, (_, _, covered) in SECTIONS[section][3].items() if not covered]
+
+def _fetchChildren(api, profile_id, section, object_id, names):
+    children = {}
+    for child in names:
+        method, fields, _ = SECTIONS[section][3][child]
+        items = iterPages(getattr(api, method), profile_id, object_id, params={'fields': fields})
+        children[child] = {_key(item): {'hash': _hash(item), 'data': item} for item in items}
+    return children
+
+def _hashNode(node):
+    node['hash'] = _hash([_hash(node['data']), {c: {k: i['hash'] for k, i in items.items()} for c, items in node['children'].items()}])
+    return node
+
+def _fetchNode(api, profile_id, section, object_id, stamp):
+    _, _, get, children = SECTIONS[section]
+    data = checkResponse(getattr(api, get)(profile_id, object_id))
+    return _hashNode({'stamp': stamp, 'data': data, 'children': _fetchChildren(api, profile_id, section, object_id, children)})
+
+def _refreshNode(api, profile_id, section, object_id, old):
+    """Copy an unchanged node from a base snapshot, fetching again the children its probe fields do not cover"""
+    children = dict(old['children'], **_fetchChildren(api, profile_id, section, object_id, _uncovered(section)))
+    return _hashNode({'stamp': old['stamp'], 'data': old['data'], 'children': children})
+
+def takeSnapshot(api, profile_id, workers:int=8, base:dict=None):
+    """Capture the configuration of a profile as a tree of content-hashed objects
+    With base, objects whose version and modified_date are unchanged are copied from it and only
+    the rest are fetched, each with its children, concurrently; children that do not change the
+    version of their parent, such as page endpoints and email alerts, are fetched either way
+    """
+    snapshot = {'profile_id': profile_id, 'taken_at': time.time(), 'sections': {}, 'fetched': 0, 'reused': 0}
+    previous = base['sections'] if base and base['profile_id'] == profile_id else {}
+
+    with ThreadPoolExecutor(workers) as pool:
+        def probe(section):
+            method, fields = SECTIONS[section][:2]
+            return section, list(iterPages(getattr(api, method), profile_id, params={'fields': fields} if fields else None))
+
+        fetches, refreshes = {}, {}
+        for section, items in pool.map(probe, SECTIONS):
+            nodes = snapshot['sections'][section] = {}
+            for item in items:
+                key, stamp = str(item['id']), _stamp(item, SECTIONS[section][1])
+                old = previous.get(section, {}).get(key)
+
+                if stamp is not None and old is not None and old['stamp'] == stamp:
+                    snapshot['reused'] += 1
+                    if _uncovered(section):
+                        refreshes[(section, key)] = pool.submit(_refreshNode, api, profile_id, section, item['id'], old)
+                    else:
+                        nodes[key] = old
+                else:
+                    fetches[(section, key)] = pool.submit(_fetchNode, api, profile_id, section, item['id'], stamp)
+
+        for (section, key), future in fetches.items():
+            snapshot['sections'][section][key] = future.result()
+            snapshot['fetched'] += 1
+
+        for (section, key), future in refreshes.items():
+            snapshot['sections'][section][key] = future.result()
+
+    return snapshot
+
+def saveSnapshot(snapshot:dict, path:str):
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+
+def loadSnapshot(path:str):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+def _diffLevel(prefix, old, new, changes, nested):
+    for key in sorted(old.keys() - new.keys()):
+        changes['removed'].append(f'{prefix}/{key}')
+
+    for key in sorted(new.keys() - old.keys()):
+        changes['added'].append(f'{prefix}/{key}')
+
+    for key in sorted(old.keys() & new.keys()):
+        if old[key]['hash'] == new[key]['hash']:
+            continue
+
+        if not nested or _hash(old[key]['data']) != _hash(new[key]['data']):
+            changes['changed'].append(f'{prefix}/{key}')
+
+        if nested:
+            for child in sorted(old[key]['children'].keys() | new[key]['children'].keys()):
+                _diffLevel(f'{prefix}/{key}/{child}', old[key]['children'].get(child, {}), new[key]['children'].get(child, {}), changes, False)
+
+def diffSnapshots(old:dict, new:dict):
+    """Compare two snapshots, descending only into objects whose hashes differ
+    Returns {'added': [path], 'removed': [path], 'changed': [path]} with paths like pages/12/elements/34
+    """
+    changes = {'added': [], 'removed': [], 'changed': []}
+
+    for section in sorted(old['sections'].keys() | new['sections'].keys()):
+        _diffLevel(section, old['sections'].get(section, {}), new['sections'].get(section, {}), changes, True)
+
+    return changes
+
+def diffLive(api, snapshot:dict, workers:int=8):
+    """Compare a snapshot with the live profile, fetching only objects whose probe fields moved"""
+    return diffSnapshots(snapshot, takeSnapshot(api, snapshot['profile_id'], workers, base=snapshot))
@@ -0,0 +1,85 @@
+import json
+from itertools import chain
+
+_decoder = json.JSONDecoder()
+WHITESPACE = ' \t\n\r'
+
+def iterJsonArray(chunks):
+    """Yield the items of a top level JSON array as they are parsed from an iterable of text chunks
+    Only the item being parsed is held in memory, not the whole document
+    """
+    chunks = iter(chunks)
+    buffer, pos = '', 0
+    expect_value = True
+    started = False
+    count = 0
+
+    def fill(buffer, pos):
+        chunk = next(chunks, None)
+        if chunk is None:
+            return None, pos
+        return buffer[pos:] + chunk, 0
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in WHITESPACE:
+            pos += 1
+
+        if pos >= len(buffer):
+            buffer, pos = fill(buffer, pos)
+            if buffer is None:
+                raise ValueError("Unexpected end of JSON array")
+            continue
+
+        char = buffer[pos]
+
+        if not started:
+            if char != '[':
+                raise ValueError("Response is not a JSON array")
+            started = True
+            pos += 1
+            continue
+
+        if char == ']' and (not expect_value or count == 0):
+            return
+
+        if not expect_value:
+            if char != ',':
+                raise ValueError(f"Expected ',' at position {pos}")
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            item, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            item, end = None, None
+
+        # a value touching the end of the buffer may be cut short (e.g. a number), so read on first
+        if end is None or end >= len(buffer):
+            more, pos = fill(buffer, pos)
+            if more is None:
+                raise ValueError("Unexpected end of JSON array")
+            buffer = more
+            continue
+
+        yield item
+        count += 1
+        pos = end
+        expect_value = False
+
+def decodeStream(chunks):
+    """Decode a JSON body from text chunks
+    Returns (None, iterator over items) for an array, or (value, None) for anything else
+    """
+    chunks = iter(chunks)
+    head = ''
+
+    for chunk in chunks:
+        head += chunk
+        if head.lstrip(WHITESPACE):
+            break
+
+    if head.lstrip(WHITESPACE).startswith('['):
+        return None, iterJsonArray(chain([head], chunks))
+
+    return json.loads(head + ''.join(chunks)), None
@@ -0,0 +1,133 @@
+import re
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .ifb import ifbResponse
+
+MAX_LIMIT = 1000
+FILTER_CHUNK_SIZE = 100
+
+SUBFORM_DATA_TYPE = 18
+
+READ_ONLY_FIELDS = ('id', 'version', 'created_date', 'created_by', 'modified_date', 'modified_by', 'global_id')
+
+class ResponseError(Exception):
+    def __init__(self, status_code:int, response):
+        self.status_code = status_code
+        self.response = response
+        super().__init__(f'<{status_code}>: {response}')
+
+def checkResponse(result):
+    """Return the body of a response, raising ResponseError for error statuses
+    Works with both ifbResponse objects and simple_response bodies
+    """
+    if isinstance(result, ifbResponse):
+        if result.status_code >= 400:
+            raise ResponseError(result.status_code, result.response)
+        return result.response
+
+    if isinstance(result, dict) and 'error_message' in result:
+        raise ResponseError(None, result)
+
+    return result
+
+def getTotalCount(result):
+    if not isinstance(result, ifbResponse):
+        raise ValueError("Total-Count requires a full ifbResponse, disable simple_response")
+
+    checkResponse(result)
+    return int(result.headers.get('Total-Count', 0))
+
+def chunks(items, size:int):
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def buildFilter(field:str, values, operator:str='='):
+    """Build a fields grammar condition matching any of values, e.g. id((="1")|(="2"))"""
+    conditions = '|'.join(f'({operator}"{value}")' for value in values)
+    return f'{field}({conditions})'
+
+def joinFields(*fields):
+    """Join fields grammar expressions, skipping empty ones"""
+    return ','.join(f for f in fields if f)
+
+def iterResponse(result):
+    """Yield the items of a list response without materializing a streamed body"""
+    if isinstance(result, ifbResponse):
+        if result.status_code >= 400:
+            raise ResponseError(result.status_code, result.response)
+        yield from result
+    else:
+        yield from checkResponse(result)
+
+def iterPages(method, *args, params=None, limit:int=MAX_LIMIT):
+    """Yield every item of a list resource by walking it with limit/offset"""
+    params = dict(params or {})
+    offset = int(params.pop('offset', 0))
+
+    while True:
+        count = 0
+        for item in iterResponse(method(*args, params={**params, 'limit': limit, 'offset': offset})):
+            count += 1
+            yield item
+
+        if count < limit:
+            return
+
+        offset += limit
+
+def iterKeyset(method, *args, params=None, limit:int=MAX_LIMIT, after=None):
+    """Yield every item of a list resource in id order by walking it with id:<(>"last id") and a limit
+    Every page costs the same at any depth, and items inserted or deleted during the walk do not shift
+    the rest the way they shift offsets. Pass after to continue from a known id; params fields must not filter on id
+    """
+    params = dict(params or {})
+    params.pop('offset', None)
+    fields = params.pop('fields', None)
+
+    if fields and re.search(r'(^|,)\s*id\s*($|[(:,])', fields):
+        raise ValueError("iterKeyset sorts and filters on id; remove id from fields")
+
+    while True:
+        count = 0
+        condition = f'id:<(>"{after}")' if after is not None else 'id:<'
+
+        for item in iterResponse(method(*args, params={**params, 'fields': joinFields(condition, fields), 'limit': limit})):
+            count += 1
+            after = item['id']
+            yield item
+
+        if count < limit:
+            return
+
+def stripReadOnly(obj:dict):
+    return {k: v for k, v in obj.items() if k not in READ_ONLY_FIELDS}
+
+def runGraph(tasks:dict, workers:int=8):
+    """Run tasks concurrently in dependency order and return their results by key
+    tasks maps a key to (fn, dependencies); fn is called with no arguments once every dependency has finished
+    """
+    for key, (fn, dependencies) in tasks.items():
+        missing = [d for d in dependencies if d not in tasks]
+        if missing:
+            raise ValueError(f"Unknown dependencies for {key}: {missing}")
+
+    results = {}
+    remaining = dict(tasks)
+    running = {}
+
+    with ThreadPoolExecutor(workers) as pool:
+        while remaining or running:
+            ready = [key for key, (fn, dependencies) in remaining.items() if all(d in results for d in dependencies)]
+            for key in ready:
+                fn, _ = remaining.pop(key)
+                running[pool.submit(fn)] = key
+
+            if not running:
+                raise ValueError(f"Dependency cycle between tasks: {list(remaining)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    return results
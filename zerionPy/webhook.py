@@ -0,0 +1,225 @@
+import hmac
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, urlencode
+
+from .utils import checkResponse, buildFilter, iterPages
+
+logger = logging.getLogger(__name__)
+
+class WebhookReceiver():
+    """Local HTTP server receiving iFormBuilder HTTP callbacks
+    Callbacks are posted to /<profile_id>/<page_id>, validated, decoded and queued as
+    {'profile_id', 'page_id', 'record'} items. Items are consumed with get(), by iterating the receiver,
+    or handed to sink in batches of up to batch_size every flush_interval seconds. The server listens on
+    localhost unless host is given; set a token before exposing it
+    """
+    def __init__(self, host:str='127.0.0.1', port:int=8080, token:str=None, sink=None, batch_size:int=100, flush_interval:float=1.0, maxsize:int=10000, max_body_size:int=10485760):
+        if batch_size < 1 or maxsize < 1:
+            raise ValueError("Invalid receiver size")
+
+        self.host = host
+        self.port = port
+        self.token = token
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_body_size = max_body_size
+
+        self.__queue = queue.Queue(maxsize)
+        self.__server = None
+        self.__threads = []
+        self.__stopping = threading.Event()
+        self.__sink_error = None
+        self.__received = 0
+        self.__rejected = 0
+        self.__lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def __iter__(self):
+        while not self.__stopping.is_set() or not self.__queue.empty():
+            try:
+                yield self.__queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    def getStats(self):
+        with self.__lock:
+            return {'received': self.__received, 'rejected': self.__rejected, 'pending': self.__queue.qsize()}
+
+    def getPort(self):
+        return self.__server.server_address[1] if self.__server is not None else self.port
+
+    def getUrl(self, base_url:str, profile_id, page_id):
+        """Return the callback URL for a page, as reachable from iFormBuilder through base_url"""
+        url = f'{base_url.rstrip("/")}/{profile_id}/{page_id}'
+        return f'{url}?{urlencode({"token": self.token})}' if self.token else url
+
+    def get(self, block:bool=True, timeout:float=None):
+        return self.__queue.get(block=block, timeout=timeout)
+
+    def handleCallback(self, path:str, body:bytes):
+        """Validate a callback and queue its records, returning the HTTP status to answer with
+        Can be called directly to feed callbacks received by another web framework
+        """
+        return self.__count(self.__accept(path, body))
+
+    def __count(self, status):
+        with self.__lock:
+            if status == 200:
+                self.__received += 1
+            else:
+                self.__rejected += 1
+
+        return status
+
+    def __accept(self, path, body):
+        url = urlsplit(path)
+        parts = [p for p in url.path.split('/') if p]
+
+        if len(parts) != 2 or not all(p.isdigit() for p in parts):
+            return 404
+
+        if self.token is not None and not hmac.compare_digest(parse_qs(url.query).get('token', [''])[0], self.token):
+            return 403
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400
+
+        records = payload if isinstance(payload, list) else [payload]
+        if not records or not all(isinstance(r, dict) for r in records):
+            return 400
+
+        profile_id, page_id = int(parts[0]), int(parts[1])
+
+        # a callback is queued whole or not at all, so the retry of a 503 cannot deliver records twice;
+        # consumers only free space, so the check holds while the lock is held
+        with self.__lock:
+            if self.__queue.maxsize - self.__queue.qsize() < len(records):
+                return 503
+            for record in records:
+                self.__queue.put_nowait({'profile_id': profile_id, 'page_id': page_id, 'record': record})
+
+        return 200
+
+    def __handler(self):
+        receiver = self
+        count = self.__count
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get('Content-Length') or 0)
+                except ValueError:
+                    length = -1
+
+                if length < 0 or length > receiver.max_body_size:
+                    # the body is left unread, so the connection cannot carry another request
+                    self.close_connection = True
+                    status = count(400 if length < 0 else 413)
+                else:
+                    status = receiver.handleCallback(self.path, self.rfile.read(length))
+
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                if self.close_connection:
+                    self.send_header('Connection', 'close')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __flush(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while not self.__stopping.is_set() or not self.__queue.empty() or batch:
+            try:
+                batch.append(self.__queue.get(timeout=max(0, min(0.5, deadline - time.monotonic()))))
+            except queue.Empty:
+                pass
+
+            if len(batch) >= self.batch_size or (batch and time.monotonic() >= deadline) or (batch and self.__stopping.is_set() and self.__queue.empty()):
+                try:
+                    self.sink(batch)
+                except Exception as e:
+                    logger.exception(f'Webhook sink failed, dropped {len(batch)} records')
+                    self.__sink_error = e
+                batch = []
+
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+    def start(self):
+        self.__stopping.clear()
+        self.__server = ThreadingHTTPServer((self.host, self.port), self.__handler())
+        self.__server.daemon_threads = True
+
+        self.__threads = [threading.Thread(target=self.__server.serve_forever, daemon=True)]
+        if self.sink is not None:
+            self.__threads.append(threading.Thread(target=self.__flush, daemon=True))
+
+        for thread in self.__threads:
+            thread.start()
+
+    def stop(self):
+        """Stop accepting callbacks, then flush anything still queued to the sink
+        Raises the last sink error, if any batch could not be delivered
+        """
+        if self.__server is None:
+            return
+
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__stopping.set()
+
+        for thread in self.__threads:
+            thread.join()
+
+        self.__server = None
+
+        if self.__sink_error is not None:
+            error, self.__sink_error = self.__sink_error, None
+            raise error
+
+def registerEndpoints(api, profile_id, page_ids, receiver:WebhookReceiver, base_url:str, body:dict=None, workers:int=8):
+    """Point the HTTP callbacks of each page at receiver and return {page_id: endpoint_id}"""
+    def register(page_id):
+        endpoint = {**(body or {}), 'url': receiver.getUrl(base_url, profile_id, page_id)}
+        return checkResponse(api.postPageEndpoints(profile_id, page_id, endpoint))['id']
+
+    page_ids = list(page_ids)
+    with ThreadPoolExecutor(workers) as pool:
+        return dict(zip(page_ids, pool.map(register, page_ids)))
+
+def unregisterEndpoints(api, profile_id, page_ids, base_url:str, workers:int=8):
+    """Remove every HTTP callback of each page whose url starts with base_url and return {page_id: removed ids}"""
+    def unregister(page_id):
+        endpoints = iterPages(api.getPageEndpoints, profile_id, page_id, params={'fields': 'url'})
+        ids = [e['id'] for e in endpoints if e.get('url', '').startswith(base_url.rstrip('/'))]
+
+        if ids:
+            checkResponse(api.deletePageEndpoints(profile_id, page_id, {'fields': buildFilter('id', ids), 'limit': len(ids)}))
+
+        return ids
+
+    page_ids = list(page_ids)
+    with ThreadPoolExecutor(workers) as pool:
+        return dict(zip(page_ids, pool.map(unregister, page_ids)))